@@ -0,0 +1,52 @@
+import itertools
+import os
+
+import pytest
+from django.apps.registry import Apps
+from django.db import models
+
+from timezone_field import TimeZoneField
+
+ROWS = 10_000
+TZSTRS = ["America/New_York", "Europe/London", "Asia/Tokyo", "Australia/Sydney", "UTC", "America/Los_Angeles"]
+
+
+# defined at import time, so django will create the DB table
+class _BenchModel(models.Model):
+    tz = TimeZoneField()
+
+    class Meta:
+        app_label = "tests"
+
+
+@pytest.fixture(params=[os.environ["TZ_ENGINE"]] if "TZ_ENGINE" in os.environ else ["pytz", "zoneinfo"])
+def use_pytz(request):
+    yield request.param == "pytz"
+
+
+@pytest.fixture
+def tzstrs():
+    yield [tzstr for _, tzstr in zip(range(ROWS), itertools.cycle(TZSTRS))]
+
+
+@pytest.fixture
+def BenchModel(use_pytz):
+    class _BenchModel(models.Model):
+        tz = TimeZoneField(use_pytz=use_pytz)
+
+        class Meta:
+            app_label = "tests"
+
+    yield _BenchModel
+
+
+@pytest.fixture
+def define_model(use_pytz):
+    "Define a model with `fields` TimeZoneFields, in a registry of its own"
+
+    def define(fields):
+        attrs = {f"tz{i}": TimeZoneField(use_pytz=use_pytz) for i in range(fields)}
+        attrs["Meta"] = type("Meta", (), {"app_label": "bench", "apps": Apps()})
+        return type("Bench", (models.Model,), {"__module__": __name__, **attrs})
+
+    yield define
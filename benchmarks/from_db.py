@@ -0,0 +1,81 @@
+"""
+Per-row cost of loading TimeZoneField values from the database.
+
+Times Model.from_db() over --rows rows, the way a queryset builds instances:
+the stored strings are first converted by from_db_value(), then the model is
+instantiated from the converted values. Then times iterating a queryset over
+the same rows in an in-memory SQLite database.
+
+    python benchmarks/from_db.py [--rows 100000] [--runs 5] [--use-pytz]
+"""
+
+import argparse
+import itertools
+import os
+import statistics
+import sys
+import time
+
+import django
+from django.conf import settings
+
+TZSTRS = ["America/New_York", "Europe/London", "Asia/Tokyo", "Australia/Sydney", "UTC", "America/Los_Angeles"]
+
+
+def median_time(runs, func):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--use-pytz", action="store_true")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    settings.configure(
+        INSTALLED_APPS=[],
+        USE_TZ=True,
+        USE_DEPRECATED_PYTZ=args.use_pytz,
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    )
+    django.setup()
+
+    # pylint: disable=import-outside-toplevel,no-member,protected-access
+    from django.db import connection, models
+
+    from timezone_field import TimeZoneField
+
+    class Bench(models.Model):
+        tz = TimeZoneField()
+
+        class Meta:
+            app_label = "bench"
+
+    field = Bench._meta.get_field("tz")
+    rows = [(i, tzstr) for i, tzstr in zip(range(args.rows), itertools.cycle(TZSTRS))]
+
+    def from_db():
+        for pk, tzstr in rows:
+            Bench.from_db("default", ["id", "tz"], [pk, field.from_db_value(tzstr, None, connection)])
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(Bench)
+    Bench.objects.bulk_create([Bench(id=pk, tz=tzstr) for pk, tzstr in rows], batch_size=5000)
+
+    def queryset():
+        list(Bench.objects.all())
+
+    for name, func in [("Model.from_db", from_db), ("list(queryset)", queryset)]:
+        elapsed = median_time(args.runs, func)
+        print(f"{name:15} {args.rows} rows: {elapsed * 1000:8.1f} ms, {elapsed / args.rows * 1e6:6.2f} us/row (median)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Worker startup cost of django-timezone-field.
+
+Each run starts a fresh interpreter, configures django, imports the package
+and defines a model with --fields TimeZoneFields (what a worker pays at
+startup), then separately times the first use of the zone list (what it no
+longer pays until a form, validation or migration needs it).
+
+    python benchmarks/import_time.py [--fields 40] [--runs 10] [--use-pytz]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SNIPPET = """
+import time
+
+import django
+from django.conf import settings
+
+settings.configure(INSTALLED_APPS=[], USE_TZ=True, USE_DEPRECATED_PYTZ={use_pytz})
+django.setup()
+
+start = time.perf_counter()
+from django.db import models
+
+from timezone_field import TimeZoneField
+from timezone_field.backends import get_tz_backend
+
+fields = {{"tz%d" % i: TimeZoneField(choices_display="WITH_GMT_OFFSET") for i in range({fields})}}
+type("Bench", (models.Model,), {{"__module__": __name__, "Meta": type("Meta", (), {{"app_label": "bench"}}), **fields}})
+defined = time.perf_counter()
+
+get_tz_backend(None).base_tzstrs
+scanned = time.perf_counter()
+print(defined - start, scanned - defined)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=40)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--use-pytz", action="store_true")
+    args = parser.parse_args()
+
+    snippet = SNIPPET.format(fields=args.fields, use_pytz=args.use_pytz)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    startup, scan = [], []
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, "-c", snippet], cwd=root, check=True, capture_output=True, text=True)
+        run_startup, run_scan = (float(value) for value in output.stdout.split())
+        startup.append(run_startup)
+        scan.append(run_scan)
+
+    print(f"import + model with {args.fields} fields: {statistics.median(startup) * 1000:8.2f} ms (median)")
+    print(f"first use of base_tzstrs (deferred):    {statistics.median(scan) * 1000:8.2f} ms (median)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmarks of the package's hot paths, under both timezone backends.
+
+    pytest benchmarks
+
+Needs pytest-benchmark, see the README for saving and comparing results.
+"""
+
+import pytest
+from django import forms
+from rest_framework import serializers
+
+from timezone_field import TimeZoneField, TimeZoneFormField
+from timezone_field.backends import get_tz_backend
+from timezone_field.choices import standard, with_gmt_offset
+from timezone_field.rest_framework import TimeZoneSerializerField
+
+pytestmark = pytest.mark.filterwarnings("ignore:Model 'tests._benchmodel' was already registered.")
+
+
+@pytest.mark.parametrize("fields", [1, 40])
+def test_model_definition(benchmark, define_model, fields):
+    benchmark(define_model, fields)
+
+
+@pytest.mark.django_db
+def test_queryset_from_db_value(benchmark, BenchModel, tzstrs):
+    BenchModel.objects.bulk_create([BenchModel(tz=tzstr) for tzstr in tzstrs], batch_size=1000)
+    instances = benchmark(lambda: list(BenchModel.objects.all()))
+    assert len(instances) == len(tzstrs)
+
+
+def test_form_field_clean(benchmark, use_pytz):
+    field = TimeZoneFormField(use_pytz=use_pytz)
+    field.clean("America/New_York")
+    benchmark(field.clean, "America/New_York")
+
+
+@pytest.mark.parametrize("choices_display", [None, "WITH_GMT_OFFSET"])
+def test_form_field_render(benchmark, use_pytz, choices_display):
+    class _Form(forms.Form):
+        tz = TimeZoneFormField(use_pytz=use_pytz, choices_display=choices_display)
+
+    html = benchmark(lambda: str(_Form(initial={"tz": "America/New_York"})["tz"]))
+    assert "America/New_York" in html
+
+
+def test_serializer_field_to_representation_many(benchmark, use_pytz, tzstrs):
+    class _Serializer(serializers.Serializer):
+        # pylint: disable=abstract-method
+        tz = TimeZoneSerializerField(use_pytz=use_pytz)
+
+    tz_backend = get_tz_backend(use_pytz)
+    instances = [{"tz": tz_backend.to_tzobj(tzstr)} for tzstr in tzstrs]
+    data = benchmark(lambda: _Serializer(instances, many=True).data)
+    assert len(data) == len(tzstrs)
+
+
+def test_serializer_field_to_internal_value_many(benchmark, use_pytz, tzstrs):
+    class _Serializer(serializers.Serializer):
+        # pylint: disable=abstract-method
+        tz = TimeZoneSerializerField(use_pytz=use_pytz)
+
+    data = [{"tz": tzstr} for tzstr in tzstrs]
+
+    def validate():
+        serializer = _Serializer(data=data, many=True)
+        assert serializer.is_valid()
+
+    benchmark(validate)
+
+
+def test_with_gmt_offset(benchmark, use_pytz):
+    benchmark(with_gmt_offset, get_tz_backend(use_pytz).base_tzstrs, use_pytz=use_pytz)
+
+
+def test_standard(benchmark, use_pytz):
+    benchmark(standard, get_tz_backend(use_pytz).base_tzstrs)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"choices_display": "WITH_GMT_OFFSET"}, {"choices": [("UTC", "UTC")]}],
+    ids=["default", "with_gmt_offset", "choices"],
+)
+def test_deconstruct(benchmark, use_pytz, kwargs):
+    # makemigrations deconstructs every field of every model, twice
+    field = TimeZoneField(use_pytz=use_pytz, **kwargs)
+    benchmark(field.deconstruct)
@@ -35,6 +35,31 @@ class _ModelOldChoiceFormat(models.Model):
     tz_subset = TimeZoneField()
 
 
+class _ModelLazy(models.Model):
+    tz = TimeZoneField()
+    tz_opt = TimeZoneField()
+
+
+class _ModelIntegerStorage(models.Model):
+    tz = TimeZoneField()
+    tz_int = TimeZoneField(integer_storage=True, null=True)
+
+
+class _ModelEvent(models.Model):
+    ts = models.DateTimeField(null=True)
+    tz = TimeZoneField()
+    tz_int = TimeZoneField(integer_storage=True)
+
+
+class _ModelRef(models.Model):
+    tz = TimeZoneField()
+    tz_int = TimeZoneField(integer_storage=True)
+
+
+class _ModelCanonical(models.Model):
+    tz = TimeZoneField()
+
+
 @pytest.fixture
 def Model(use_pytz):
     class _Model(models.Model):
@@ -79,6 +104,51 @@ def ModelOldChoiceFormat(use_pytz, all_tzstrs, to_tzobj):
     yield _ModelOldChoiceFormat
 
 
+@pytest.fixture
+def ModelLazy(use_pytz):
+    class _ModelLazy(models.Model):
+        tz = TimeZoneField(use_pytz=use_pytz, lazy_deserialization=True)
+        tz_opt = TimeZoneField(blank=True, use_pytz=use_pytz, lazy_deserialization=True)
+
+    yield _ModelLazy
+
+
+@pytest.fixture
+def ModelIntegerStorage(use_pytz):
+    class _ModelIntegerStorage(models.Model):
+        tz = TimeZoneField(blank=True, use_pytz=use_pytz)
+        tz_int = TimeZoneField(blank=True, null=True, integer_storage=True, use_pytz=use_pytz)
+
+    yield _ModelIntegerStorage
+
+
+@pytest.fixture
+def ModelEvent(use_pytz):
+    class _ModelEvent(models.Model):
+        ts = models.DateTimeField(null=True)
+        tz = TimeZoneField(blank=True, use_pytz=use_pytz)
+        tz_int = TimeZoneField(blank=True, integer_storage=True, use_pytz=use_pytz)
+
+    yield _ModelEvent
+
+
+@pytest.fixture
+def ModelRef(use_pytz):
+    class _ModelRef(models.Model):
+        tz = TimeZoneField(blank=True, use_pytz=use_pytz, use_refs=True)
+        tz_int = TimeZoneField(blank=True, integer_storage=True, use_pytz=use_pytz, use_refs=True)
+
+    yield _ModelRef
+
+
+@pytest.fixture
+def ModelCanonical(use_pytz):
+    class _ModelCanonical(models.Model):
+        tz = TimeZoneField(use_pytz=use_pytz, canonical_choices=True, canonicalize=True)
+
+    yield _ModelCanonical
+
+
 @pytest.fixture
 def ModelForm(Model):
     class _ModelForm(forms.ModelForm):
@@ -0,0 +1,41 @@
+import asyncio
+import gc
+
+import timezone_field
+from timezone_field.apps import TimeZoneFieldConfig, aprewarm, prewarm
+from timezone_field.backends import get_tz_backend
+
+
+def test_prewarm(use_pytz, base_tzstrs):
+    tz_backend = get_tz_backend(use_pytz)
+    tz_backend.tzobj_cache.cache_clear()
+    prewarm(use_pytz, max_workers=4)
+    assert tz_backend.tzobj_cache.cache_info().currsize == len(base_tzstrs)
+
+
+def test_prewarm_freeze(use_pytz, pst):
+    try:
+        prewarm(use_pytz, [pst], freeze=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_aprewarm(use_pytz, pst, gmt):
+    tz_backend = get_tz_backend(use_pytz)
+    tz_backend.tzobj_cache.cache_clear()
+    asyncio.run(aprewarm(use_pytz, [pst, gmt]))
+    assert tz_backend.tzobj_cache.cache_info().currsize == 2
+
+
+def test_ready(settings):
+    tz_backend = get_tz_backend(None)
+    app_config = TimeZoneFieldConfig("timezone_field", timezone_field)
+
+    tz_backend.tzobj_cache.cache_clear()
+    app_config.ready()
+    assert tz_backend.tzobj_cache.cache_info().currsize == 0
+
+    settings.TIMEZONE_FIELD_PREWARM = True
+    app_config.ready()
+    assert tz_backend.tzobj_cache.cache_info().currsize == len(tz_backend.base_tzstrs)
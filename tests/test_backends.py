@@ -1,7 +1,13 @@
+import io
+
+import pytest
 from django import VERSION
 
-from timezone_field.backends import USE_PYTZ_DEFAULT, get_tz_backend
-from timezone_field.backends.zoneinfo import ZoneInfoBackend
+from timezone_field.backends import USE_PYTZ_DEFAULT, TimeZoneNotFoundError, get_tz_backend
+from timezone_field.backends import zoneinfo as zoneinfo_backend
+from timezone_field.backends.base import CacheInfo, TzObjCache
+from timezone_field.backends.tzdb import read_links, read_zone_tab
+from timezone_field.backends.zoneinfo import ZoneInfoBackend, available_timezones, zoneinfo
 
 
 def test_use_pytz_default_USE_DEPRECATED_PYTZ_unset():
@@ -24,3 +30,131 @@ else:
 
     def test_get_tz_backend_when_use_pytz_is_true():
         assert isinstance(get_tz_backend(True), PYTZBackend)
+
+
+def test_zoneinfo_backend_defers_available_timezones(monkeypatch):
+    calls = []
+    monkeypatch.setattr(zoneinfo, "available_timezones", lambda: calls.append(None) or {"UTC", "Factory"})
+    available_timezones.cache_clear()
+    try:
+        tz_backend = ZoneInfoBackend()
+        assert not calls
+        assert tz_backend.all_tzstrs == {"UTC"}
+        assert tz_backend.base_tzstrs is tz_backend.all_tzstrs
+        assert len(calls) == 1
+    finally:
+        available_timezones.cache_clear()
+
+
+def test_zoneinfo_available_timezones_disk_cache(monkeypatch, settings, tmp_path):
+    settings.TIMEZONE_FIELD_CACHE_DIR = str(tmp_path)
+    calls = []
+    monkeypatch.setattr(zoneinfo, "available_timezones", lambda: calls.append(None) or {"UTC", "Factory"})
+    monkeypatch.setattr(zoneinfo_backend, "tzdb_version_key", lambda: ["2024a", []])
+    try:
+        available_timezones.cache_clear()
+        assert available_timezones() == {"UTC"}
+        assert [path.name for path in tmp_path.iterdir()] == ["zoneinfo-tzstrs.json"]
+
+        # another process: read from the cache file
+        available_timezones.cache_clear()
+        assert available_timezones() == {"UTC"}
+        assert len(calls) == 1
+
+        # the timezone DB changed: rescan
+        monkeypatch.setattr(zoneinfo_backend, "tzdb_version_key", lambda: ["2024b", []])
+        available_timezones.cache_clear()
+        assert available_timezones() == {"UTC"}
+        assert len(calls) == 2
+
+        # unreadable cache file: rescan
+        (tmp_path / "zoneinfo-tzstrs.json").write_text("{")
+        available_timezones.cache_clear()
+        assert available_timezones() == {"UTC"}
+        assert len(calls) == 3
+        assert [path.name for path in tmp_path.iterdir()] == ["zoneinfo-tzstrs.json"]
+    finally:
+        available_timezones.cache_clear()
+
+
+def test_tzobj_cache():
+    calls = []
+    cache = TzObjCache(lambda tzstr: calls.append(tzstr) or tzstr.upper(), maxsize=2)
+    assert cache.get("a") == "A"
+    assert cache.get("a") == "A"
+    assert cache.get("b") == "B"
+    assert cache.cache_info() == CacheInfo(hits=1, misses=2, maxsize=2, currsize=2)
+
+    # "b" is the least recently used
+    cache.get("a")
+    cache.get("c")
+    assert cache.cache_info() == CacheInfo(hits=2, misses=3, maxsize=2, currsize=2)
+    cache.get("a")
+    cache.get("b")
+    assert calls == ["a", "b", "c", "b"]
+
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_get_tzobj_does_not_cache_invalid_tzstrs(use_pytz):
+    tz_backend = get_tz_backend(use_pytz)
+    with pytest.raises(TimeZoneNotFoundError):
+        tz_backend.get_tzobj("Invalid/Zone")
+    assert "Invalid/Zone" not in tz_backend.tzobj_cache.data
+    assert tz_backend.get_tzobj("Europe/Paris") is tz_backend.get_tzobj("Europe/Paris")
+
+
+def test_build_tzobj(use_pytz):
+    tz_backend = get_tz_backend(use_pytz)
+    tzobj = tz_backend.build_tzobj("Europe/Paris")
+    assert tz_backend.is_tzobj(tzobj)
+    assert str(tzobj) == "Europe/Paris"
+    assert tzobj is not tz_backend.to_tzobj("Europe/Paris")
+    assert tzobj is not tz_backend.build_tzobj("Europe/Paris")
+    with pytest.raises(TimeZoneNotFoundError):
+        tz_backend.build_tzobj("Invalid/Zone")
+
+
+def test_read_links():
+    tzdata_zi = io.BytesIO(
+        b"# version 2026a\n"
+        b"Z America/New_York -4:56:2 - LMT 1883 N 18 17u\n"
+        b"L America/New_York US/Eastern\n"
+        b"L US/Eastern EST5EDT\n"
+        b"L Etc/UTC UTC\n"
+    )
+    assert read_links(tzdata_zi) == {"US/Eastern": "America/New_York", "EST5EDT": "America/New_York", "UTC": "Etc/UTC"}
+
+
+def test_backend_links(use_pytz):
+    tz_backend = get_tz_backend(use_pytz)
+    assert tz_backend.links
+    assert set(tz_backend.links) <= set(tz_backend.all_tzstrs)
+    assert set(tz_backend.links.values()) <= set(tz_backend.all_tzstrs) - set(tz_backend.links)
+    assert tz_backend.canonicalize("US/Eastern") == "America/New_York"
+    assert tz_backend.canonicalize("America/New_York") == "America/New_York"
+    assert tz_backend.canonicalize("UTC") == "UTC"
+    assert tz_backend.canonicalize("Etc/UTC") == "UTC"
+    assert tz_backend.canonicalize("Zulu") == "UTC"
+    assert tz_backend.canonicalize("Etc/GMT") == "GMT"
+
+
+def test_read_zone_tab():
+    zone_tab = io.BytesIO(
+        b"# tzdb timezone descriptions\n"
+        b"#\n"
+        b"CH,DE,LI\t+5230+01322\tEurope/Berlin\tmost of Germany\n"
+        b"US\t+404251-0740023\tAmerica/New_York\tEastern (most areas)\n"
+    )
+    assert read_zone_tab(zone_tab) == ["Europe/Berlin", "America/New_York"]
+
+
+def test_backend_canonical_tzstrs(use_pytz):
+    tz_backend = get_tz_backend(use_pytz)
+    assert "America/New_York" in tz_backend.canonical_tzstrs
+    assert "UTC" in tz_backend.canonical_tzstrs
+    # canonicalize() leaves every one of them unchanged
+    assert not set(tz_backend.canonical_tzstrs) & set(tz_backend.links)
+    assert set(tz_backend.canonical_tzstrs) <= set(tz_backend.base_tzstrs)
+    assert [str(tz) for tz in tz_backend.canonical_tzobjs] == list(tz_backend.canonical_tzstrs)
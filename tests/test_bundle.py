@@ -0,0 +1,101 @@
+import copy
+import datetime
+import pickle
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from timezone_field import backends
+from timezone_field.backends import TimeZoneNotFoundError, get_tz_backend
+from timezone_field.backends.bundle import BundleBackend, BundleError, BundleZoneInfo, build_bundle
+from timezone_field.management.commands.timezone_field_bundle import Command
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    path = tmp_path / "tz.bundle"
+    build_bundle(path)
+    yield path
+
+
+@pytest.fixture
+def bundle_backend(bundle_path):
+    yield BundleBackend(bundle_path)
+
+
+def test_all_tzstrs(bundle_backend):
+    assert bundle_backend.all_tzstrs == get_tz_backend(False).all_tzstrs
+
+
+def test_to_tzobj(bundle_backend, pst):
+    tzobj = bundle_backend.to_tzobj(pst)
+    assert isinstance(tzobj, BundleZoneInfo)
+    assert str(tzobj) == pst
+    assert tzobj is bundle_backend.to_tzobj(pst)
+    assert bundle_backend.is_tzobj(tzobj)
+    dt = datetime.datetime(2026, 7, 1, 12, tzinfo=tzobj)
+    assert dt.utcoffset() == datetime.timedelta(hours=-7)
+    assert dt.tzname() == "PDT"
+    assert bundle_backend.utc_tzobj is bundle_backend.to_tzobj("UTC")
+
+
+@pytest.mark.parametrize("tzstr", ["Invalid/Zone", "", None, "tzdata.zi"])
+def test_to_tzobj_not_found(bundle_backend, tzstr):
+    with pytest.raises(TimeZoneNotFoundError):
+        bundle_backend.to_tzobj(tzstr)
+
+
+def test_transitions(bundle_backend):
+    zoneinfo_backend = get_tz_backend(False)
+    for tzstr in ["America/New_York", "Asia/Tokyo", "UTC", "Australia/Lord_Howe"]:
+        times, offsets = bundle_backend.transitions(tzstr)
+        expected_times, expected_offsets = zoneinfo_backend.transitions(tzstr)
+        assert list(times) == list(expected_times)
+        assert list(offsets) == list(expected_offsets)
+
+
+def test_links(bundle_backend):
+    assert bundle_backend.links == get_tz_backend(False).links
+    assert bundle_backend.canonical_tzstrs == get_tz_backend(False).canonical_tzstrs
+
+
+def test_pickle(bundle_backend, monkeypatch, pst):
+    monkeypatch.setattr(backends, "tz_backend_cache", {False: bundle_backend})
+    tzobj = bundle_backend.to_tzobj(pst)
+    assert pickle.loads(pickle.dumps(tzobj)) is tzobj
+    assert copy.deepcopy(tzobj) is tzobj
+
+
+def test_get_tz_backend(bundle_path, monkeypatch, settings):
+    monkeypatch.setattr(backends, "tz_backend_cache", {})
+    settings.TIMEZONE_FIELD_BUNDLE = str(bundle_path)
+    assert isinstance(get_tz_backend(False), BundleBackend)
+    assert not isinstance(get_tz_backend(True), BundleBackend)
+
+
+def test_invalid_bundle(tmp_path):
+    path = tmp_path / "tz.bundle"
+    path.write_bytes(b"TZif" + b"\0" * 60)
+    with pytest.raises(BundleError):
+        BundleBackend(path)
+
+
+def test_truncated_bundle(bundle_path, tmp_path):
+    path = tmp_path / "truncated.bundle"
+    path.write_bytes(bundle_path.read_bytes()[:1000])
+    with pytest.raises(BundleError):
+        BundleBackend(path)
+
+
+def test_command(tmp_path):
+    path = tmp_path / "tz.bundle"
+    stdout = StringIO()
+    call_command(Command(), str(path), stdout=stdout)
+    assert f"timezones to {path}" in stdout.getvalue()
+    assert BundleBackend(path).all_tzstrs == get_tz_backend(False).all_tzstrs
+
+
+def test_command_no_path():
+    with pytest.raises(CommandError):
+        call_command(Command())
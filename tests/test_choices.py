@@ -1,8 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 
-from timezone_field.choices import standard, with_gmt_offset
+from timezone_field import TimeZoneField, TimeZoneFormField
+from timezone_field.choices import FrozenChoices, GMTOffsetChoices, LazyChoices, get_choices, standard, with_gmt_offset
 
 
 @pytest.fixture
@@ -121,3 +122,72 @@ def test_standard_using_timezone_objects(tzs3_names, tzs3_names_sorted, tzs3_sta
     tzs3_objects = [to_tzobj(tz) for tz in tzs3_names]
     tzs3_objects_sorted = [to_tzobj(tz) for tz in tzs3_names_sorted]
     assert standard(tzs3_objects) == list(zip(tzs3_objects_sorted, tzs3_standard_displays))
+
+
+def test_get_choices_matches_standard(tzs3_names, use_pytz):
+    assert get_choices(tzs3_names, use_pytz=use_pytz) == standard(tzs3_names)
+    assert get_choices(tzs3_names, "STANDARD", use_pytz=use_pytz) == standard(tzs3_names)
+
+
+def test_get_choices_matches_with_gmt_offset(tzs1, use_pytz):
+    assert get_choices(tzs1, "WITH_GMT_OFFSET", use_pytz=use_pytz) == with_gmt_offset(tzs1, use_pytz=use_pytz)
+
+
+def test_get_choices_is_shared(tzs3_names, use_pytz):
+    assert get_choices(tzs3_names, use_pytz=use_pytz) is get_choices(list(tzs3_names), use_pytz=use_pytz)
+
+
+@pytest.mark.parametrize("choices_display", [None, "STANDARD", "WITH_GMT_OFFSET"])
+def test_fields_share_choices(choices_display, use_pytz):
+    field1 = TimeZoneField(choices_display=choices_display, use_pytz=use_pytz)
+    field2 = TimeZoneField(choices_display=choices_display, use_pytz=use_pytz)
+    assert field1.choices._get_choices() is field2.choices._get_choices()  # pylint: disable=protected-access
+
+    form_field1 = TimeZoneFormField(choices_display=choices_display, use_pytz=use_pytz)
+    form_field2 = TimeZoneFormField(choices_display=choices_display, use_pytz=use_pytz)
+    assert form_field1.choices == form_field2.choices
+
+
+def test_get_choices_with_gmt_offset_follows_transitions(use_pytz, utc_tzobj):
+    tz_names = ["Europe/London"]
+    before = datetime(2021, 3, 28, 0, 59, 59, tzinfo=utc_tzobj)
+    after = datetime(2021, 3, 28, 1, 0, 0, tzinfo=utc_tzobj)
+    choices = get_choices(tz_names, "WITH_GMT_OFFSET", use_pytz=use_pytz, now=before)
+    assert choices == [("Europe/London", "GMT+00:00 Europe/London")]
+    assert choices.expires == after.timestamp()
+    assert get_choices(tz_names, "WITH_GMT_OFFSET", use_pytz=use_pytz, now=before) is choices
+    assert get_choices(tz_names, "WITH_GMT_OFFSET", use_pytz=use_pytz, now=after) == [
+        ("Europe/London", "GMT+01:00 Europe/London")
+    ]
+    # going back in time rebuilds from scratch
+    assert get_choices(tz_names, "WITH_GMT_OFFSET", use_pytz=use_pytz, now=before) == choices
+
+
+def test_gmt_offset_choices_only_recomputes_transitioned_zones(tzs2, use_pytz, utc_tzobj, monkeypatch):
+    winter = datetime(2021, 1, 15, tzinfo=utc_tzobj)
+    spring = datetime(2021, 3, 20, tzinfo=utc_tzobj)
+    gmt_offset_choices = GMTOffsetChoices(tzs2, use_pytz=use_pytz)
+    choices = gmt_offset_choices.get(winter)
+    assert choices == with_gmt_offset(tzs2, now=winter, use_pytz=use_pytz)
+    # Canada/Newfoundland springs forward first, at 02:00 NST
+    assert choices.expires == datetime(2021, 3, 14, 5, 30, tzinfo=timezone.utc).timestamp()
+
+    offset_table = gmt_offset_choices.offset_table
+    recomputed = []
+    offset_at = offset_table.offset_at
+    monkeypatch.setattr(offset_table, "offset_at", lambda i, when: recomputed.append(tzs2[i]) or offset_at(i, when))
+    assert gmt_offset_choices.get(spring) == with_gmt_offset(tzs2, now=spring, use_pytz=use_pytz)
+    assert sorted(set(recomputed)) == ["America/Los_Angeles", "Canada/Newfoundland"]
+
+
+def test_lazy_choices_rebuilds_when_expired():
+    builds = []
+
+    def build():
+        builds.append(None)
+        return FrozenChoices(["UTC"], ["UTC"], expires=0)
+
+    choices = LazyChoices(build)
+    assert choices[0] == ("UTC", "UTC")
+    assert choices[0] == ("UTC", "UTC")
+    assert len(builds) == 2
@@ -0,0 +1,67 @@
+from io import StringIO
+
+import pytest
+from django import forms
+from django.core.management import call_command
+
+from timezone_field import TimeZoneFormField
+from timezone_field.backends import get_tz_backend
+from timezone_field.management.commands.timezone_field_stats import Command, collect, tzobjs_size
+
+
+class _StatsForm(forms.Form):
+    tz = TimeZoneFormField()
+    tz_same = TimeZoneFormField()
+    tz_offset = TimeZoneFormField(choices_display="WITH_GMT_OFFSET")
+
+
+def test_timezone_field_stats():
+    stdout = StringIO()
+    call_command(Command(), stdout=stdout)
+    output = stdout.getvalue()
+    assert "tests._Model.tz " in output
+    assert "tests.test_commands._StatsForm.tz " in output
+    assert "distinct choice lists" in output
+
+
+def test_collect():
+    structures, usages = collect()
+    sizes = {structure.name: structure.size for structure in structures}
+    counts = {structure.name: structure.count for structure in structures}
+    assert len(sizes) == len(structures)
+    usages = {usage.label: usage for usage in usages}
+
+    form_usage = usages["tests.test_commands._StatsForm.tz"]
+    assert form_usage.choices == usages["tests.test_commands._StatsForm.tz_same"].choices
+    assert form_usage.default_tzs is None
+    offset_usage = usages["tests.test_commands._StatsForm.tz_offset"]
+    assert offset_usage.choices != form_usage.choices
+    model_usage = usages["tests._Model.tz"]
+    assert model_usage.default_tzs == "ZoneInfoBackend.base_tzobjs"
+
+    base_count = len(get_tz_backend(False).base_tzstrs)
+    assert counts[form_usage.choices] == counts[offset_usage.choices] == base_count
+    # at least a (value, display) tuple per choice
+    assert sizes[form_usage.choices] > base_count * 56
+    # the offsets table kept to refresh the displays
+    assert sizes[offset_usage.choices] > sizes[form_usage.choices]
+    # the tuple, not the timezone objects it shares with the choices
+    assert base_count * 8 < sizes["ZoneInfoBackend.base_tzobjs"] < base_count * 16
+    assert counts["ZoneInfoBackend timezone objects"] >= base_count
+    assert sizes["ZoneInfoBackend timezone objects"] > base_count * 500
+
+    # the same sizes, whatever is measured first or was built before
+    new_sizes = {structure.name: structure.size for structure in collect()[0]}
+    tzobjs_name = "ZoneInfoBackend timezone objects"
+    # up to the noise of the allocations of new timezone objects
+    assert new_sizes.pop(tzobjs_name) == pytest.approx(sizes.pop(tzobjs_name), rel=0.05)
+    assert new_sizes == sizes
+
+
+def test_tzobjs_size(use_pytz, pst):
+    tz_backend = get_tz_backend(use_pytz)
+    # pytz memoizes the offsets of the objects it builds
+    tzobjs_size(tz_backend, [pst])
+    size = tzobjs_size(tz_backend, [pst])
+    assert size > 500
+    assert 1.5 * size < tzobjs_size(tz_backend, [pst, pst]) < 2.5 * size
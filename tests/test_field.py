@@ -1,8 +1,12 @@
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import connection, models
 from pytest_lazy_fixtures import lf as lazy_fixture
 
-from timezone_field import TimeZoneField
+from timezone_field import TimeZoneField, fields
+from timezone_field.backends import get_tz_backend
+from timezone_field.choices import standard_sort_key
+from timezone_field.utils import RawDBValue
 
 pytestmark = pytest.mark.filterwarnings("ignore:Model 'tests._model.*' was already registered.")
 
@@ -129,3 +133,141 @@ def test_with_limited_choices_old_format_invalid_choice(ModelOldChoiceFormat, kw
     with pytest.raises(ValidationError):
         m = ModelOldChoiceFormat(**kwargs)
         m.full_clean()
+
+
+def test_model_definition_does_not_load_timezones(use_pytz, monkeypatch):
+    def fail(*_args, **_kwargs):
+        raise AssertionError("timezones loaded while defining the model")
+
+    monkeypatch.setattr(get_tz_backend(use_pytz), "to_tzobj", fail)
+    monkeypatch.setattr(fields, "get_choices", fail)
+
+    class _ModelLazyChoices(models.Model):
+        tz = TimeZoneField(use_pytz=use_pytz)
+        tz_with_gmt_offset = TimeZoneField(choices_display="WITH_GMT_OFFSET", use_pytz=use_pytz)
+        tz_limited = TimeZoneField(choices=[("US/Pacific", "US/Pacific")], use_pytz=use_pytz)
+
+    monkeypatch.undo()
+    m = _ModelLazyChoices(tz="US/Pacific", tz_with_gmt_offset="US/Pacific", tz_limited="US/Pacific")
+    m.full_clean()  # builds and validates against the choices
+
+
+def test_with_limited_choices_invalid_choice_message(ModelChoice, to_tzobj):
+    m = ModelChoice(tz_subset="Europe/Brussels")
+    with pytest.raises(ValidationError) as excinfo:
+        m.full_clean()
+    error = excinfo.value.error_dict["tz_subset"][0]
+    assert error.code == "invalid_choice"
+    assert error.messages == [f"Value {to_tzobj('Europe/Brussels')!r} is not a valid choice."]
+
+
+def test_validate_with_replaced_choices(use_pytz, to_tzobj, pst, pst_tz):
+    field = TimeZoneField(use_pytz=use_pytz)
+    field.choices = [(pst_tz, pst)]
+    field.validate(pst_tz, None)
+    with pytest.raises(ValidationError):
+        field.validate(to_tzobj("Europe/Brussels"), None)
+
+
+def test_conversions_use_tzobj_cache(use_pytz, pst, pst_tz):
+    field = TimeZoneField(use_pytz=use_pytz)
+    cache = field.tz_backend.tzobj_cache
+    cache.cache_clear()
+    assert field.from_db_value(pst, None, None) == pst_tz
+    assert field.to_python(pst) == pst_tz
+    assert field.get_prep_value(pst) == pst
+    assert (cache.cache_info().hits, cache.cache_info().misses) == (2, 1)
+
+
+def test_set_tzobj_skips_to_python(monkeypatch, Model, pst, pst_tz):
+    field = Model._meta.get_field("tz")  # pylint: disable=protected-access
+    calls = []
+    monkeypatch.setattr(field, "to_python", lambda value: calls.append(value) or pst_tz)
+    m = Model(tz=pst_tz, tz_opt=None)
+    assert m.tz is pst_tz
+    assert not calls
+    m.tz = pst
+    assert m.tz is pst_tz
+    assert calls == [pst]
+
+
+@pytest.mark.django_db
+def test_lazy_deserialization(ModelLazy, use_pytz, pst, pst_tz):
+    ModelLazy.objects.create(tz=pst, tz_opt="")
+    m = ModelLazy.objects.get()
+    assert m.__dict__["tz"] == pst
+    assert not get_tz_backend(use_pytz).is_tzobj(m.__dict__["tz"])
+    assert m.tz == pst_tz
+    assert m.__dict__["tz"] is m.tz
+    assert m.tz_opt is None
+    assert ModelLazy.objects.filter(tz=m.tz).count() == 1
+    assert list(ModelLazy.objects.values_list("tz", flat=True)) == [pst]
+
+    field = ModelLazy._meta.get_field("tz")  # pylint: disable=protected-access
+    assert field.get_prep_value(m.tz) == pst
+    assert "lazy_deserialization" not in field.deconstruct()[3]
+
+
+@pytest.mark.django_db
+def test_lazy_deserialization_values(ModelLazy, use_pytz, pst):
+    ModelLazy.objects.create(tz=pst, tz_opt="")
+    # no model instance to convert them when read: values() and values_list()
+    # return the names loaded from the DB
+    (values,) = ModelLazy.objects.values("tz", "tz_opt")
+    assert values == {"tz": pst, "tz_opt": None}
+    assert isinstance(values["tz"], RawDBValue)
+    assert not get_tz_backend(use_pytz).is_tzobj(values["tz"])
+    (tz,) = ModelLazy.objects.values_list("tz", flat=True)
+    assert isinstance(tz, RawDBValue)
+    assert tz == pst
+
+
+@pytest.mark.django_db
+def test_lazy_deserialization_invalid_value_raises_on_read(ModelLazy):
+    ModelLazy.objects.create(tz="UTC")
+    with connection.cursor() as cursor:
+        table = ModelLazy._meta.db_table  # pylint: disable=protected-access
+        cursor.execute(f"UPDATE {table} SET tz = %s", ["Invalid/Zone"])
+    m = ModelLazy.objects.get()
+    with pytest.raises(ValidationError):
+        m.tz  # pylint: disable=pointless-statement
+
+
+def test_canonicalize(use_pytz, to_tzobj):
+    field = TimeZoneField(use_pytz=use_pytz, canonicalize=True)
+    assert field.get_prep_value("US/Eastern") == "America/New_York"
+    assert field.get_prep_value(to_tzobj("US/Eastern")) == "America/New_York"
+    assert field.get_prep_value("Europe/Paris") == "Europe/Paris"
+    assert field.get_prep_value(None) == ""
+    assert field.deconstruct()[3] == {"use_pytz": use_pytz, "canonicalize": True}
+    assert TimeZoneField(use_pytz=use_pytz).get_prep_value("US/Eastern") == "US/Eastern"
+
+
+@pytest.mark.django_db
+def test_canonicalize_integer_storage(ModelIntegerStorage):
+    field = ModelIntegerStorage._meta.get_field("tz_int")  # pylint: disable=protected-access
+    field.canonicalize = True
+    m = ModelIntegerStorage.objects.create(tz_int="US/Pacific")
+    assert str(ModelIntegerStorage.objects.get(pk=m.pk).tz_int) == "America/Los_Angeles"
+    assert ModelIntegerStorage.objects.filter(tz_int="US/Pacific").count() == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "tz, stored",
+    [("UTC", "UTC"), ("Etc/UTC", "UTC"), ("US/Pacific", "America/Los_Angeles"), ("Europe/Paris", "Europe/Paris")],
+)
+def test_canonicalize_canonical_choices(ModelCanonical, tz, stored):
+    m = ModelCanonical.objects.create(tz=tz)
+    m = ModelCanonical.objects.get(pk=m.pk)
+    assert str(m.tz) == stored
+    m.full_clean()
+
+
+def test_canonical_choices(use_pytz, to_tzobj):
+    field = TimeZoneField(use_pytz=use_pytz, canonical_choices=True)
+    assert [str(tz) for tz, _ in field.choices] == sorted(field.tz_backend.canonical_tzstrs, key=standard_sort_key)
+    field.validate(to_tzobj("America/Los_Angeles"), None)
+    with pytest.raises(ValidationError):
+        field.validate(to_tzobj("US/Pacific"), None)
+    assert field.deconstruct()[3] == {"use_pytz": use_pytz, "canonical_choices": True}
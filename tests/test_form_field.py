@@ -68,3 +68,29 @@ def test_form_invalid_choice_valid(FormInvalidChoice, pst, pst_tz):
 def test_form_invalid_chocie_invalid_choice(FormInvalidChoice, invalid_tz):
     form = FormInvalidChoice({"tz": invalid_tz})
     assert not form.is_valid()
+
+
+def test_form_reassigned_choices(Form, pst, pst_tz, gmt):
+    form = Form({"tz": pst})
+    form.fields["tz"].choices = [(gmt, gmt)]
+    assert not form.is_valid()
+
+    form = Form({"tz": pst})
+    form.fields["tz"].choices = [("Group", [(gmt, gmt), (pst, pst)])]
+    assert form.is_valid()
+    assert form.cleaned_data["tz"] == pst_tz
+
+
+def test_form_reassigned_choices_does_not_affect_other_forms(Form, pst, gmt):
+    form = Form({"tz": pst})
+    form.fields["tz"].choices = [(gmt, gmt)]
+    assert Form({"tz": pst}).is_valid()
+
+
+def test_form_canonical_choices(use_pytz, pst):
+    class _Form(forms.Form):
+        tz = TimeZoneFormField(canonical_choices=True, use_pytz=use_pytz)
+
+    assert _Form({"tz": pst}).is_valid()
+    assert _Form({"tz": "UTC"}).is_valid()
+    assert not _Form({"tz": "US/Pacific"}).is_valid()
@@ -0,0 +1,74 @@
+import datetime
+
+import pytest
+from django.db import NotSupportedError, connection
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+from timezone_field.functions import LocalTime, local_time
+from timezone_field.zone_ids import zone_id
+
+pytestmark = pytest.mark.filterwarnings("ignore:Model 'tests._model.*' was already registered.")
+
+UTC = datetime.timezone.utc
+
+
+@pytest.fixture
+def events(ModelEvent):
+    for ts, tz in [
+        (datetime.datetime(2026, 1, 15, 12, 30, tzinfo=UTC), "Asia/Tokyo"),
+        (datetime.datetime(2026, 1, 15, 16, 0, tzinfo=UTC), "Asia/Tokyo"),
+        (datetime.datetime(2026, 7, 15, 12, 30, tzinfo=UTC), "America/New_York"),
+        (datetime.datetime(2026, 1, 15, 12, 30, tzinfo=UTC), "America/New_York"),
+        (datetime.datetime(2026, 1, 15, 12, 30, tzinfo=UTC), ""),
+        (None, "UTC"),
+    ]:
+        ModelEvent.objects.create(ts=ts, tz=tz, tz_int=tz)
+    yield ModelEvent
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("tz_field", ["tz", "tz_int"])
+def test_local_time(events, tz_field):
+    local_times = events.objects.annotate(local=LocalTime("ts", tz_field)).order_by("pk")
+    assert [event.local for event in local_times] == [
+        datetime.datetime(2026, 1, 15, 21, 30, tzinfo=UTC),
+        datetime.datetime(2026, 1, 16, 1, 0, tzinfo=UTC),
+        datetime.datetime(2026, 7, 15, 8, 30, tzinfo=UTC),
+        datetime.datetime(2026, 1, 15, 7, 30, tzinfo=UTC),
+        None,
+        None,
+    ]
+    assert local_times.filter(local__hour=21).count() == 1
+    assert local_times.filter(local__date=datetime.date(2026, 1, 15)).count() == 2
+
+
+@pytest.mark.django_db
+def test_local_time_aggregation(events):
+    per_day = (
+        events.objects.annotate(day=TruncDate(LocalTime("ts", "tz")))
+        .values("day")
+        .annotate(count=Count("pk"))
+        .order_by("day")
+    )
+    assert [(row["day"], row["count"]) for row in per_day if row["day"]] == [
+        (datetime.date(2026, 1, 15), 2),
+        (datetime.date(2026, 1, 16), 1),
+        (datetime.date(2026, 7, 15), 1),
+    ]
+
+
+def test_local_time_function():
+    assert local_time("2026-01-15 12:30:00", "Asia/Kolkata") == "2026-01-15 18:00:00"
+    assert local_time("2026-01-15 12:30:00.000123", zone_id("Asia/Tokyo")) == "2026-01-15 21:30:00.000123"
+    # past the transition tables
+    assert local_time("2050-07-01 12:00:00", "Europe/Paris") == "2050-07-01 14:00:00"
+    assert local_time("2026-01-15 12:30:00", "Invalid/Zone") is None
+    assert local_time("2026-01-15 12:30:00", -1) is None
+    assert local_time(None, "UTC") is None
+
+
+def test_local_time_unsupported_backend(monkeypatch, ModelEvent):
+    monkeypatch.setattr(connection, "vendor", "oracle")
+    with pytest.raises(NotSupportedError):
+        str(ModelEvent.objects.annotate(local=LocalTime("ts", "tz")).query)
@@ -0,0 +1,84 @@
+import pytest
+from django.core.exceptions import ValidationError
+from rest_framework import serializers
+
+from timezone_field import TimeZoneField, TimeZoneFormField, instrumentation
+from timezone_field.backends import get_tz_backend
+from timezone_field.choices import FrozenChoices, LazyChoices
+from timezone_field.rest_framework import TimeZoneSerializerField
+
+
+@pytest.fixture
+def events():
+    recorded = []
+
+    def callback(event, duration, info):
+        recorded.append((event, duration, info))
+
+    instrumentation.reset()
+    instrumentation.enable()
+    instrumentation.add_callback(callback)
+    yield recorded
+    instrumentation.remove_callback(callback)
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default():
+    assert instrumentation.enabled is False
+    instrumentation.record("field.invalid")
+    assert not instrumentation.counters
+
+
+def test_tzobj_cache_events(use_pytz, events, pst):
+    tz_backend = get_tz_backend(use_pytz)
+    tz_backend.tzobj_cache.cache_clear()
+    tz_backend.get_tzobj(pst)
+    tz_backend.get_tzobj(pst)
+    assert instrumentation.counters["tzobj_cache.miss"] == 1
+    assert instrumentation.counters["tzobj_cache.hit"] == 1
+    assert instrumentation.timers["tzobj_cache.miss"] > 0
+    assert events[0] == ("tzobj_cache.miss", instrumentation.timers["tzobj_cache.miss"], {"tzstr": pst})
+    assert events[1] == ("tzobj_cache.hit", None, {"tzstr": pst})
+
+
+def test_invalid_events(use_pytz, events, invalid_tz):
+    tz_backend = get_tz_backend(use_pytz)
+    tz_backend.tzobj_cache.cache_clear()
+    with pytest.raises(ValidationError):
+        TimeZoneField(use_pytz=use_pytz).to_python(invalid_tz)
+    with pytest.raises(ValidationError):
+        TimeZoneFormField(use_pytz=use_pytz).coerce(invalid_tz)
+
+    class _Serializer(serializers.Serializer):  # pylint: disable=abstract-method
+        tz = TimeZoneSerializerField(use_pytz=use_pytz)
+
+    assert not _Serializer(data={"tz": invalid_tz}).is_valid()
+    assert instrumentation.counters["tzobj_cache.not_found"] == 3
+    assert instrumentation.counters["field.invalid"] == 1
+    assert instrumentation.counters["form_field.invalid"] == 1
+    assert instrumentation.counters["serializer_field.invalid"] == 1
+    assert [event for event, _, _ in events].count("tzobj_cache.not_found") == 3
+
+
+def test_choices_build_events(events):
+    choices = LazyChoices(lambda: FrozenChoices(["UTC"], ["UTC"]))
+    list(choices)
+    list(choices)
+    assert instrumentation.counters["choices.build"] == 1
+    assert events == [("choices.build", instrumentation.timers["choices.build"], {})]
+
+
+@pytest.mark.usefixtures("events")
+def test_signal():
+    received = []
+
+    def receiver(sender, event, duration, info, **kwargs):  # pylint: disable=unused-argument
+        received.append((event, duration, info))
+
+    instrumentation.event_recorded.connect(receiver)
+    try:
+        instrumentation.record("field.invalid", value="x")
+    finally:
+        instrumentation.event_recorded.disconnect(receiver)
+    assert received == [("field.invalid", None, {"value": "x"})]
@@ -0,0 +1,100 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.migrations.state import ProjectState
+from django.db.migrations.writer import MigrationWriter
+
+from timezone_field import TimeZoneField
+from timezone_field.backends import get_tz_backend
+from timezone_field.operations import CopyTimeZones, copy_timezones
+from timezone_field.zone_ids import ZONE_IDS, ZONE_NAMES, zone_id, zone_name
+
+pytestmark = pytest.mark.filterwarnings("ignore:Model 'tests._model.*' was already registered.")
+
+
+def test_zone_ids_cover_backends(use_pytz):
+    tzstrs = set(get_tz_backend(use_pytz).all_tzstrs)
+    # present on some systems, eg: a symlink to the system's timezone
+    tzstrs.discard("localtime")
+    assert tzstrs <= set(ZONE_NAMES)
+
+
+def test_zone_ids():
+    assert ZONE_NAMES[0] == ""
+    assert len(ZONE_IDS) == len(ZONE_NAMES)
+    assert zone_name(zone_id("Europe/Paris")) == "Europe/Paris"
+    with pytest.raises(ValidationError):
+        zone_id("Invalid/Zone")
+    for value in [-1, len(ZONE_NAMES), "1"]:
+        with pytest.raises(ValidationError):
+            zone_name(value)
+
+
+def test_deconstruct():
+    field = TimeZoneField(integer_storage=True)
+    name, path, args, kwargs = field.deconstruct()
+    assert kwargs == {"integer_storage": True}
+    assert TimeZoneField(name, path, *args, **kwargs).get_internal_type() == "SmallIntegerField"
+    assert TimeZoneField().get_internal_type() == "CharField"
+
+
+@pytest.mark.django_db
+def test_stores_integers(ModelIntegerStorage, pst, pst_tz):
+    m = ModelIntegerStorage.objects.create(tz_int=pst)
+    ModelIntegerStorage.objects.create(tz_int="")
+    with connection.cursor() as cursor:
+        table = ModelIntegerStorage._meta.db_table  # pylint: disable=protected-access
+        cursor.execute(f"SELECT tz_int FROM {table} ORDER BY id")
+        assert cursor.fetchall() == [(zone_id(pst),), (0,)]
+
+    m = ModelIntegerStorage.objects.get(pk=m.pk)
+    assert m.tz_int == pst_tz
+    assert list(ModelIntegerStorage.objects.filter(tz_int=pst_tz)) == [m]
+    assert list(ModelIntegerStorage.objects.filter(tz_int__in=[pst, "UTC"])) == [m]
+    assert ModelIntegerStorage.objects.exclude(pk=m.pk).get().tz_int is None
+
+
+@pytest.mark.django_db
+def test_stores_zone_name_ids(ModelIntegerStorage, use_pytz):
+    if not use_pytz:
+        pytest.skip("zoneinfo names are case sensitive")
+    # pytz finds zones whatever the capitalization of their name
+    m = ModelIntegerStorage.objects.create(tz_int="us/pacific")
+    assert str(ModelIntegerStorage.objects.get(pk=m.pk).tz_int) == "US/Pacific"
+    assert ModelIntegerStorage.objects.filter(tz_int="us/pacific").count() == 1
+
+
+@pytest.mark.django_db
+def test_copy_timezones(ModelIntegerStorage, pst, pst_tz, utc_tzobj):
+    tzs = [pst, "UTC", "", pst, pst]
+    ModelIntegerStorage.objects.bulk_create([ModelIntegerStorage(tz=tz) for tz in tzs])
+    copy_timezones(ModelIntegerStorage, "tz", "tz_int", batch_size=2)
+    assert list(ModelIntegerStorage.objects.order_by("pk").values_list("tz_int", flat=True)) == [
+        pst_tz,
+        utc_tzobj,
+        None,
+        pst_tz,
+        pst_tz,
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_copy_timezones_operation(ModelIntegerStorage, pst, pst_tz):
+    ModelIntegerStorage.objects.create(tz=pst)
+    operation = CopyTimeZones("_modelintegerstorage", "tz", "tz_int", batch_size=10)
+    state = ProjectState.from_apps(ModelIntegerStorage._meta.apps)  # pylint: disable=protected-access
+    with connection.schema_editor() as schema_editor:
+        operation.database_forwards("tests", schema_editor, state, state)
+    assert ModelIntegerStorage.objects.get().tz_int == pst_tz
+
+    ModelIntegerStorage.objects.update(tz="")
+    with connection.schema_editor() as schema_editor:
+        operation.database_backwards("tests", schema_editor, state, state)
+    assert ModelIntegerStorage.objects.get().tz == pst_tz
+
+    assert operation.deconstruct() == (
+        "CopyTimeZones",
+        [],
+        {"model_name": "_modelintegerstorage", "from_field": "tz", "to_field": "tz_int", "batch_size": 10},
+    )
+    MigrationWriter.serialize(operation)  # should not throw
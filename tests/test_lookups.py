@@ -0,0 +1,134 @@
+import datetime
+
+import pytest
+
+from timezone_field import lookups
+from timezone_field.backends import get_tz_backend
+from timezone_field.lookups import OffsetGroups, local_date_filter, local_date_windows
+
+pytestmark = pytest.mark.filterwarnings("ignore:Model 'tests._model.*' was already registered.")
+
+# 2026-01-15 12:30 UTC: northern hemisphere winter
+UTC = datetime.timezone.utc
+NOW = datetime.datetime(2026, 1, 15, 12, 30, tzinfo=UTC)
+# America/New_York switches to DST
+DST_DAY = datetime.date(2026, 3, 8)
+
+
+def local_utcoffset(tzobj, day):
+    "UTC offset at the start of `day` in tzobj"
+    midnight = datetime.datetime.combine(day, datetime.time())
+    if hasattr(tzobj, "localize"):  # pytz
+        return tzobj.localize(midnight).utcoffset()
+    return midnight.replace(tzinfo=tzobj).utcoffset()
+
+
+@pytest.fixture
+def now(monkeypatch):
+    monkeypatch.setattr(lookups.time, "time", NOW.timestamp)
+
+
+def test_offset_groups(use_pytz):
+    tz_backend = get_tz_backend(use_pytz)
+    offset_groups = OffsetGroups(tz_backend)
+    groups = offset_groups.get(NOW.timestamp())
+    assert sorted(tzstr for tzstrs in groups.values() for tzstr in tzstrs) == sorted(tz_backend.all_tzstrs)
+    for tzstr in ["America/New_York", "Asia/Tokyo", "Australia/Adelaide", "UTC"]:
+        offset = tz_backend.to_tzobj(tzstr).utcoffset(NOW.replace(tzinfo=None))
+        assert tzstr in groups[int(offset.total_seconds())]
+
+    # reused until the next transition
+    _, valid_from, expires = offset_groups.state
+    assert offset_groups.get(NOW.timestamp() + 3600) is groups
+    assert valid_from < expires < NOW.timestamp() + 365 * 86400
+    summer = offset_groups.get(datetime.datetime(2026, 7, 15, tzinfo=datetime.timezone.utc).timestamp())
+    assert "America/New_York" in summer[-4 * 3600]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("now")
+def test_current_offset(Model):
+    for tz in ["Asia/Tokyo", "Asia/Seoul", "Europe/Paris", "America/New_York"]:
+        Model.objects.create(tz=tz)
+    queryset = Model.objects.filter(tz__current_offset=datetime.timedelta(hours=9))
+    assert sorted(str(m.tz) for m in queryset) == ["Asia/Seoul", "Asia/Tokyo"]
+    assert " IN (" in str(queryset.query)
+    assert not Model.objects.filter(tz__current_offset=datetime.timedelta(hours=9, minutes=17)).exists()
+    assert Model.objects.exclude(tz__current_offset=datetime.timedelta(hours=-5)).count() == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("now")
+def test_local_hour(Model):
+    for tz in ["Asia/Tokyo", "Asia/Kolkata", "Europe/Paris", "America/New_York"]:
+        Model.objects.create(tz=tz)
+    # 12:30 UTC
+    assert [str(m.tz) for m in Model.objects.filter(tz__local_hour=21)] == ["Asia/Tokyo"]
+    assert [str(m.tz) for m in Model.objects.filter(tz__local_hour=18)] == ["Asia/Kolkata"]
+    assert [str(m.tz) for m in Model.objects.filter(tz__local_hour=13)] == ["Europe/Paris"]
+    assert [str(m.tz) for m in Model.objects.filter(tz__local_hour=7)] == ["America/New_York"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("now")
+def test_lookups_with_integer_storage(ModelIntegerStorage):
+    ModelIntegerStorage.objects.create(tz_int="Asia/Tokyo")
+    ModelIntegerStorage.objects.create(tz_int="Europe/Paris")
+    assert [str(m.tz_int) for m in ModelIntegerStorage.objects.filter(tz_int__local_hour=21)] == ["Asia/Tokyo"]
+    assert ModelIntegerStorage.objects.filter(tz_int__current_offset=datetime.timedelta(hours=1)).count() == 1
+
+
+def test_local_date_windows(use_pytz):
+    tz_backend = get_tz_backend(use_pytz)
+    windows = dict((tzstr, window) for window, tzstrs in local_date_windows(tz_backend, DST_DAY) for tzstr in tzstrs)
+    assert local_date_windows(tz_backend, DST_DAY) is local_date_windows(tz_backend, DST_DAY)
+    assert sorted(windows) == sorted(tz_backend.all_tzstrs)
+    for tzstr in ["America/New_York", "Asia/Tokyo", "Europe/Paris", "UTC"]:
+        tzobj = tz_backend.to_tzobj(tzstr)
+        start, end = (
+            (datetime.datetime.combine(day, datetime.time()) - local_utcoffset(tzobj, day)).replace(tzinfo=UTC)
+            for day in [DST_DAY, DST_DAY + datetime.timedelta(days=1)]
+        )
+        assert windows[tzstr] == (start.timestamp(), end.timestamp())
+    # a 23 hour day
+    start, end = windows["America/New_York"]
+    assert end - start == 23 * 3600
+
+
+@pytest.mark.parametrize(
+    "tzstr, day, start_hour, end_hour",
+    [
+        # DST starts at local midnight: the day starts at 01:00 local time
+        ("America/Santiago", datetime.date(2026, 9, 6), 4, 27),
+        ("America/Santiago", datetime.date(2026, 9, 5), 4, 28),
+        ("America/Havana", DST_DAY, 5, 28),
+        ("America/Havana", DST_DAY - datetime.timedelta(days=1), 5, 29),
+    ],
+)
+def test_local_date_windows_gap_at_midnight(use_pytz, tzstr, day, start_hour, end_hour):
+    tz_backend = get_tz_backend(use_pytz)
+    windows = dict((tzstr, window) for window, tzstrs in local_date_windows(tz_backend, day) for tzstr in tzstrs)
+    midnight = datetime.datetime.combine(day, datetime.time(), UTC)
+    assert windows[tzstr] == tuple(
+        (midnight + datetime.timedelta(hours=hour)).timestamp() for hour in (start_hour, end_hour)
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("tz_field", ["tz", "tz_int"])
+@pytest.mark.parametrize("day", [DST_DAY, datetime.date(2026, 9, 6)])
+def test_local_date_filter(ModelEvent, tz_field, use_pytz, day):
+    tz_backend = get_tz_backend(use_pytz)
+    events = []
+    tzs = ["America/New_York", "Asia/Tokyo", "Europe/Paris", "Pacific/Kiritimati", "Pacific/Pago_Pago"]
+    for tz in tzs + ["America/Havana", "America/Santiago"]:
+        for half_hours in range(-72, 120, 3):
+            ts = datetime.datetime.combine(day, datetime.time(), UTC) + datetime.timedelta(minutes=30 * half_hours)
+            events.append(ModelEvent.objects.create(ts=ts, **{tz_field: tz}))
+    expected = [
+        event.pk
+        for event in events
+        if event.ts.astimezone(tz_backend.to_tzobj(str(getattr(event, tz_field)))).date() == day
+    ]
+    queryset = ModelEvent.objects.filter(local_date_filter(ModelEvent, "ts", tz_field, day))
+    assert sorted(queryset.values_list("pk", flat=True)) == expected
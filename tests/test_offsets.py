@@ -0,0 +1,87 @@
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from timezone_field.backends import get_tz_backend, offsets
+from timezone_field.choices import with_gmt_offset
+
+
+@pytest.fixture(params=["numpy", "python"])
+def offset_table_impl(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(offsets, "numpy", None)
+    yield request.param
+
+
+@pytest.fixture
+def tz_names():
+    yield ["Europe/London", "UTC", "Asia/Kolkata", "America/Santiago", "America/Los_Angeles"]
+
+
+@pytest.mark.usefixtures("offset_table_impl")
+def test_offsets_at(use_pytz, tz_names):
+    table = get_tz_backend(use_pytz).offset_table(tz_names)
+    summer = datetime(2020, 7, 15, tzinfo=timezone.utc).timestamp()
+    winter = datetime(2020, 1, 15, tzinfo=timezone.utc).timestamp()
+    assert table.offsets_at(summer) == [3600, 0, 19800, -14400, -25200]
+    assert table.offsets_at(winter) == [0, 0, 19800, -10800, -28800]
+    assert [table.offset_at(i, summer) for i in range(len(tz_names))] == table.offsets_at(summer)
+
+
+@pytest.mark.usefixtures("offset_table_impl")
+def test_next_transitions(use_pytz, tz_names):
+    table = get_tz_backend(use_pytz).offset_table(tz_names)
+    winter = datetime(2021, 1, 15, tzinfo=timezone.utc).timestamp()
+    assert table.next_transitions(winter) == [
+        datetime(2021, 3, 28, 1, tzinfo=timezone.utc).timestamp(),
+        None,
+        None,
+        datetime(2021, 4, 4, 3, tzinfo=timezone.utc).timestamp(),
+        datetime(2021, 3, 14, 10, tzinfo=timezone.utc).timestamp(),
+    ]
+    assert [table.next_transition(i, winter) for i in range(len(tz_names))] == table.next_transitions(winter)
+
+
+@pytest.mark.usefixtures("offset_table_impl")
+def test_offset_table_matches_timezone_objects(use_pytz, base_tzstrs, to_tzobj):
+    tz_strs = sorted(base_tzstrs)
+    table = get_tz_backend(use_pytz).offset_table(tz_strs)
+    tzobjs = [to_tzobj(tz) for tz in tz_strs]
+    when = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    while when.year < 2037:
+        expected = [int(when.astimezone(tz).utcoffset().total_seconds()) for tz in tzobjs]
+        assert table.offsets_at(when.timestamp()) == expected
+        when += timedelta(days=397, hours=5)
+
+
+def test_next_transition(use_pytz, to_tzobj, utc_tzobj):
+    tz_backend = get_tz_backend(use_pytz)
+    after = datetime(2021, 1, 15, tzinfo=utc_tzobj)
+    assert tz_backend.next_transition(to_tzobj("Europe/London"), after) == datetime(2021, 3, 28, 1, tzinfo=utc_tzobj)
+    assert tz_backend.next_transition(to_tzobj("UTC"), after) is None
+
+
+@pytest.mark.usefixtures("offset_table_impl")
+def test_with_gmt_offset(use_pytz, tz_names, utc_tzobj):
+    now = datetime(2020, 7, 15, tzinfo=utc_tzobj)
+    assert with_gmt_offset(tz_names, now=now, use_pytz=use_pytz) == [
+        ("America/Los_Angeles", "GMT-07:00 America/Los Angeles"),
+        ("America/Santiago", "GMT-04:00 America/Santiago"),
+        ("UTC", "GMT+00:00 UTC"),
+        ("Europe/London", "GMT+01:00 Europe/London"),
+        ("Asia/Kolkata", "GMT+05:30 Asia/Kolkata"),
+    ]
+
+
+def test_numpy_imported_lazily():
+    code = (
+        "import django, sys; django.setup(); import timezone_field, timezone_field.backends.base; "
+        "print('numpy' in sys.modules)"
+    )
+    env = {"DJANGO_SETTINGS_MODULE": "tests.settings", "PATH": ""}
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
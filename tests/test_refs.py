@@ -0,0 +1,91 @@
+import copy
+import pickle
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from timezone_field import TimeZoneField
+from timezone_field.zone_ids import ZONE_NAMES, TimeZoneRef, zone_id
+
+pytestmark = pytest.mark.filterwarnings("ignore:Model 'tests._model.*' was already registered.")
+
+
+def test_ref(to_tzobj, use_pytz, pst):
+    ref = TimeZoneRef.for_name(pst)
+    assert ref is TimeZoneRef(zone_id(pst))
+    assert ref.id == zone_id(pst)
+    assert ref.name == str(ref) == pst
+    assert repr(ref) == f"TimeZoneRef('{pst}')"
+    assert ref == TimeZoneRef.for_name(pst)
+    assert ref != TimeZoneRef.for_name("Europe/Paris")
+    assert hash(ref) == ref.id
+    assert ref.resolve(use_pytz) == to_tzobj(pst)
+    assert not hasattr(ref, "__dict__")
+
+
+def test_ref_pickle(pst):
+    ref = TimeZoneRef.for_name(pst)
+    assert pickle.loads(pickle.dumps(ref)) is ref
+    assert copy.deepcopy(ref) is ref
+    # a lone ref carries the class's path, longer than most names
+    assert len(pickle.dumps(ref)) <= 64
+    assert len(pickle.dumps(ref)) > len(pickle.dumps(pst))
+    # which is written once per pickle: further refs are pickled as their ID
+    refs = [TimeZoneRef(ref_id) for ref_id in range(1, len(ZONE_NAMES))]
+    assert len(pickle.dumps(refs)) < 10 * len(refs)
+    assert len(pickle.dumps(refs)) < len(pickle.dumps(ZONE_NAMES[1:])) / 1.5
+    # repeated refs are pickled as references to the first one
+    assert len(pickle.dumps([ref] * 1000)) < 3000
+
+
+@pytest.mark.parametrize("value", [0, -1, 100000, "1"])
+def test_ref_invalid_id(value):
+    with pytest.raises(ValidationError):
+        TimeZoneRef(value)
+
+
+def test_ref_invalid_name(invalid_tz):
+    with pytest.raises(ValidationError):
+        TimeZoneRef.for_name(invalid_tz)
+
+
+@pytest.mark.django_db
+def test_field_refs(ModelRef, pst, pst_tz, gmt_tz):
+    obj = ModelRef.objects.create(tz=pst, tz_int=gmt_tz)
+    assert obj.tz is TimeZoneRef.for_name(pst)
+    assert obj.tz_int is TimeZoneRef.for_name(str(gmt_tz))
+    obj.full_clean()
+
+    obj = ModelRef.objects.get(pk=obj.pk)
+    assert obj.tz is TimeZoneRef.for_name(pst)
+    assert obj.tz.resolve(ModelRef.tz.field.use_pytz) == pst_tz
+    assert obj.tz_int is TimeZoneRef.for_name(str(gmt_tz))
+    assert ModelRef.objects.filter(tz=obj.tz, tz_int=obj.tz_int).count() == 1
+
+    obj.tz = ""
+    obj.save()
+    assert ModelRef.objects.get(pk=obj.pk).tz is None
+
+
+@pytest.mark.django_db
+def test_field_refs_invalid(ModelRef, invalid_tz):
+    with pytest.raises(ValidationError):
+        ModelRef(tz=invalid_tz)
+
+
+def test_deconstruct():
+    _, _, _, kwargs = TimeZoneField(use_refs=True).deconstruct()
+    assert kwargs == {}
+
+
+def test_field_refs_zone_names(ModelRef, use_pytz):
+    field = ModelRef._meta.get_field("tz")  # pylint: disable=protected-access
+    assert field.from_db_value("America/Los_Angeles") is TimeZoneRef.for_name("America/Los_Angeles")
+    assert field.from_db_value("") is None
+    if use_pytz:
+        # pytz finds zones whatever the capitalization of their name
+        assert field.to_python("us/pacific") is TimeZoneRef.for_name("US/Pacific")
+        assert field.from_db_value("us/pacific") is TimeZoneRef.for_name("US/Pacific")
+    # names with no ID can't be loaded as refs
+    with pytest.raises(ValidationError):
+        field.from_db_value("localtime")
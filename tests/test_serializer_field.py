@@ -1,7 +1,8 @@
 import pytest
 from rest_framework import serializers
 
-from timezone_field.rest_framework import TimeZoneSerializerField
+from timezone_field.backends import get_tz_backend
+from timezone_field.rest_framework import TimeZoneSchemaMixin, TimeZoneSerializerField
 
 
 @pytest.fixture
@@ -81,3 +82,77 @@ def test_invalid_empties(TimeZoneSerializerEmpties):
     assert not serializer.is_valid()
     assert serializer.data == {"tz_allow_null": "", "tz_allow_blank": None, "tz_not_required": None}
     assert serializer.validated_data == {}
+
+
+def test_choices(use_pytz, pst, pst_tz, gmt):
+    class _TimeZoneSerializer(serializers.Serializer):
+        # pylint: disable=abstract-method
+        tz = TimeZoneSerializerField(use_pytz=use_pytz, choices=[pst])
+
+    serializer = _TimeZoneSerializer(data={"tz": pst})
+    assert serializer.is_valid()
+    assert serializer.validated_data["tz"] == pst_tz
+
+    serializer = _TimeZoneSerializer(data={"tz": gmt})
+    assert not serializer.is_valid()
+    assert serializer.errors == {"tz": [f'"{gmt}" is not a valid choice.']}
+
+
+def test_many_converts_once(TimeZoneSerializer, use_pytz, pst, pst_tz, gmt, invalid_tz):
+    tz_backend = get_tz_backend(use_pytz)
+    tz_backend.tzobj_cache.cache_clear()
+    serializer = TimeZoneSerializer(data=[{"tz": pst}, {"tz": gmt}, {"tz": pst}, {"tz": pst}], many=True)
+    assert serializer.is_valid()
+    assert [item["tz"] for item in serializer.validated_data] == [pst_tz, tz_backend.to_tzobj(gmt), pst_tz, pst_tz]
+    hits, misses, _, _ = tz_backend.tzobj_cache.cache_info()
+    assert hits + misses == 2
+
+    serializer = TimeZoneSerializer(data=[{"tz": pst}, {"tz": invalid_tz}, {"tz": invalid_tz}], many=True)
+    assert not serializer.is_valid()
+
+
+def test_single_has_no_conversions(TimeZoneSerializer, pst):
+    serializer = TimeZoneSerializer(data={"tz": pst})
+    assert serializer.is_valid()
+    assert serializer.fields["tz"].conversions is None
+
+
+def test_schema(TimeZoneSerializer, use_pytz, all_tzstrs):
+    schema = TimeZoneSerializer().fields["tz"].get_schema()
+    assert schema == {"type": "string", "enum": sorted(all_tzstrs), "example": "UTC"}
+    # built once per backend and timezones, but each caller gets its own copy
+    schema["enum"].append("Invalid/Zone")
+    assert TimeZoneSerializer().fields["tz"].get_schema()["enum"] == sorted(all_tzstrs)
+    assert TimeZoneSerializerField(use_pytz=use_pytz, allow_blank=True).get_schema()["enum"][:2] == [
+        "",
+        "Africa/Abidjan",
+    ]
+    assert TimeZoneSerializerField(use_pytz=use_pytz, choices=["Europe/Paris", "Asia/Tokyo"]).get_schema() == {
+        "type": "string",
+        "enum": ["Asia/Tokyo", "Europe/Paris"],
+        "example": "Asia/Tokyo",
+    }
+
+
+def test_auto_schema(TimeZoneSerializer, all_tzstrs):
+    from rest_framework.schemas.openapi import AutoSchema  # pylint: disable=import-outside-toplevel
+
+    class _AutoSchema(TimeZoneSchemaMixin, AutoSchema):
+        pass
+
+    schema = _AutoSchema().map_serializer(TimeZoneSerializer())
+    assert schema["properties"]["tz"] == {"type": "string", "enum": sorted(all_tzstrs), "example": "UTC"}
+
+
+def test_spectacular_schema(TimeZoneSerializer, all_tzstrs):
+    pytest.importorskip("drf_spectacular")
+    # pylint: disable=import-outside-toplevel
+    from drf_spectacular.openapi import AutoSchema
+
+    # only defined when drf-spectacular is installed
+    from timezone_field.rest_framework import TimeZoneSerializerFieldExtension
+
+    field = TimeZoneSerializer().fields["tz"]
+    assert TimeZoneSerializerFieldExtension.get_match(field)
+    schema = AutoSchema()._map_serializer_field(field, "response")  # pylint: disable=protected-access
+    assert schema == {"type": "string", "enum": sorted(all_tzstrs), "example": "UTC"}
@@ -0,0 +1,41 @@
+import gc
+
+from asgiref.sync import sync_to_async
+from django.apps import AppConfig
+from django.conf import settings
+
+from timezone_field.backends import get_tz_backend
+
+
+class TimeZoneFieldConfig(AppConfig):
+    """
+    With "timezone_field" in INSTALLED_APPS and the TIMEZONE_FIELD_PREWARM
+    setting True, every timezone in the default backend's base_tzstrs is
+    loaded at startup, see `prewarm`. TIMEZONE_FIELD_PREWARM_GC_FREEZE = True
+    also calls gc.freeze() afterwards.
+    """
+
+    name = "timezone_field"
+
+    def ready(self):
+        if getattr(settings, "TIMEZONE_FIELD_PREWARM", False):
+            prewarm(freeze=getattr(settings, "TIMEZONE_FIELD_PREWARM_GC_FREEZE", False))
+
+
+def prewarm(use_pytz=None, tzstrs=None, max_workers=None, freeze=False):
+    """
+    Load the timezones tzstrs (default: base_tzstrs) into the backend's cache,
+    in parallel, and optionally gc.freeze() them and everything else loaded so
+    far: the garbage collector then leaves them alone, so the memory pages
+    stay shared between processes forked afterwards (eg: gunicorn workers
+    with --preload) rather than being copied by each one's first collection.
+    """
+    tz_backend = get_tz_backend(use_pytz)
+    tz_backend.prewarm(tzstrs, max_workers)
+    if freeze:
+        gc.freeze()
+
+
+async def aprewarm(use_pytz=None, tzstrs=None, max_workers=None, freeze=False):
+    "`prewarm` for async code (eg: an ASGI lifespan startup handler), run from a thread"
+    await sync_to_async(prewarm, thread_sensitive=False)(use_pytz, tzstrs, max_workers, freeze)
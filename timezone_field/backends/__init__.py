@@ -10,15 +10,20 @@ tz_backend_cache = {}
 def get_tz_backend(use_pytz):
     use_pytz = USE_PYTZ_DEFAULT if use_pytz is None else use_pytz
     if use_pytz not in tz_backend_cache:
+        bundle_path = getattr(conf.settings, "TIMEZONE_FIELD_BUNDLE", None)
         if use_pytz:
             from .pytz import PYTZBackend
 
-            klass = PYTZBackend
+            tz_backend = PYTZBackend()
+        elif bundle_path:
+            from .bundle import BundleBackend
+
+            tz_backend = BundleBackend(bundle_path)
         else:
             from .zoneinfo import ZoneInfoBackend
 
-            klass = ZoneInfoBackend
-        tz_backend_cache[use_pytz] = klass()
+            tz_backend = ZoneInfoBackend()
+        tz_backend_cache[use_pytz] = tz_backend
     return tz_backend_cache[use_pytz]
 
 
@@ -1,15 +1,127 @@
+import datetime
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from django.utils.functional import cached_property
+
+from timezone_field import instrumentation
+
+from .offsets import OffsetTable
+from .tzdb import read_links, read_zone_tab
 
 
 class TimeZoneNotFoundError(Exception):
     pass
 
 
+# The timezone DB's names for these zones are links to Etc/UTC and Etc/GMT,
+# but UTC and GMT are the names people use, and UTC one of canonical_tzstrs.
+PREFERRED_NAMES = {"Etc/UTC": "UTC", "Etc/GMT": "GMT"}
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class TzObjCache:
+    """
+    A bounded, least recently used, mapping of timezone strings to the timezone
+    objects built from them.
+
+    Loading rows converts the same few strings over and over. A dict lookup is
+    cheaper than the backend's own validation, locking and caching on each one.
+    """
+
+    def __init__(self, to_tzobj, maxsize):
+        self.to_tzobj = to_tzobj
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, tzstr):
+        try:
+            tzobj = self.data[tzstr]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            try:
+                self.data.move_to_end(tzstr)
+            except KeyError:  # evicted by another thread in the meantime
+                pass
+            if instrumentation.enabled:
+                instrumentation.record("tzobj_cache.hit", tzstr=tzstr)
+            return tzobj
+
+        self.misses += 1
+        if instrumentation.enabled:
+            tzobj = self._instrumented_to_tzobj(tzstr)
+        else:
+            tzobj = self.to_tzobj(tzstr)
+        self.data[tzstr] = tzobj
+        while len(self.data) > self.maxsize:
+            try:
+                self.data.popitem(last=False)
+            except KeyError:
+                break
+        return tzobj
+
+    def _instrumented_to_tzobj(self, tzstr):
+        try:
+            with instrumentation.timed("tzobj_cache.miss", tzstr=tzstr):
+                return self.to_tzobj(tzstr)
+        except TimeZoneNotFoundError:
+            instrumentation.record("tzobj_cache.not_found", tzstr=tzstr)
+            raise
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.data))
+
+    def cache_clear(self):
+        self.data.clear()
+        self.hits = self.misses = 0
+
+
 class TimeZoneBackend(ABC):
     utc_tzobj = None
     all_tzstrs = None
     base_tzstrs = None
 
+    # more than the number of zones in the timezone DB, it's only reached with
+    # many spellings of the same zones (pytz is case-insensitive)
+    tzobj_cache_size = 1024
+
+    def __init__(self):
+        # tzstr -> (times, offsets)
+        self.transitions_cache = {}
+        self.tzobj_cache = TzObjCache(self.to_tzobj, self.tzobj_cache_size)
+
+    @cached_property
+    def base_tzobjs(self):
+        return tuple(self.to_tzobj(tzstr) for tzstr in self.base_tzstrs)
+
+    @cached_property
+    def canonical_tzstrs(self):
+        """
+        The canonical timezones people are expected to choose from: those of
+        the timezone DB's zone1970.tab (zone.tab if missing), and UTC.
+        """
+        for name in ("zone1970.tab", "zone.tab"):
+            try:
+                with self.open_db_file(name) as fobj:
+                    tzstrs = set(read_zone_tab(fobj))
+                break
+            except TimeZoneNotFoundError:
+                continue
+        else:
+            tzstrs = set(self.base_tzstrs)
+        tzstrs.add("UTC")
+        return tuple(sorted(tzstrs & set(self.all_tzstrs)))
+
+    @cached_property
+    def canonical_tzobjs(self):
+        return tuple(self.to_tzobj(tzstr) for tzstr in self.canonical_tzstrs)
+
     @abstractmethod
     def is_tzobj(self, value):
         pass
@@ -17,3 +129,76 @@ class TimeZoneBackend(ABC):
     @abstractmethod
     def to_tzobj(self, tzstr):
         pass
+
+    @abstractmethod
+    def build_tzobj(self, tzstr):
+        "A new timezone object for tzstr, bypassing every cache (eg: to measure its size)"
+
+    @cached_property
+    def links(self):
+        "Dict of link name (eg: US/Eastern) -> canonical timezone name (eg: America/New_York)"
+        links = self.load_links()
+        for db_name, name in PREFERRED_NAMES.items():
+            if links.get(name) == db_name:
+                links = {link: name if target == db_name else target for link, target in links.items() if link != name}
+                links[db_name] = name
+        return links
+
+    def canonicalize(self, tzstr):
+        "The canonical name of the timezone tzstr, which may be a link"
+        return self.links.get(tzstr, tzstr)
+
+    def load_links(self):
+        try:
+            with self.open_db_file("tzdata.zi") as fobj:
+                return read_links(fobj)
+        except TimeZoneNotFoundError:
+            return {}
+
+    @abstractmethod
+    def open_db_file(self, name):
+        "Open the timezone DB's file `name` (eg: tzdata.zi) in binary mode, or raise TimeZoneNotFoundError"
+
+    @abstractmethod
+    def load_transitions(self, tzstr):
+        """
+        Return (times, offsets) arrays describing tzstr's UTC offset history:
+        transition instants in POSIX seconds, ascending, and offsets in seconds,
+        with offsets[0] in effect before times[0] and offsets[i + 1] from times[i].
+        """
+
+    def get_tzobj(self, tzstr):
+        "Cached to_tzobj(), see tzobj_cache.cache_info() for its statistics"
+        return self.tzobj_cache.get(tzstr)
+
+    def prewarm(self, tzstrs=None, max_workers=None):
+        """
+        Load each of tzstrs (default: base_tzstrs) into the tzobj cache from a
+        pool of max_workers threads, so the first requests using a timezone
+        don't pay for reading its file. Returns the timezone objects.
+        """
+        tzstrs = self.base_tzstrs if tzstrs is None else tzstrs
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(self.get_tzobj, tzstrs))
+
+    def transitions(self, tzstr):
+        "Cached load_transitions()"
+        try:
+            return self.transitions_cache[tzstr]
+        except KeyError:
+            return self.transitions_cache.setdefault(tzstr, self.load_transitions(tzstr))
+
+    def offset_table(self, tzstrs):
+        "OffsetTable of the UTC offset histories of each of tzstrs"
+        return OffsetTable([self.transitions(tzstr) for tzstr in tzstrs])
+
+    def next_transition(self, tzobj, after):
+        """
+        Return the first UTC datetime after the aware datetime `after` at which
+        tzobj's UTC offset changes, or None if it never does.
+        """
+        times, _ = self.transitions(str(tzobj))
+        index = bisect_right(times, after.timestamp())
+        if index == len(times):
+            return None
+        return datetime.datetime.fromtimestamp(times[index], self.utc_tzobj)
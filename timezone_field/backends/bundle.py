@@ -0,0 +1,226 @@
+"""
+A timezone backend reading every zone from a single precompiled bundle file,
+built from the installed timezone DB by the timezone_field_bundle management
+command and selected with the TIMEZONE_FIELD_BUNDLE setting.
+
+The file is memory mapped: the processes using it share its pages, and each
+zone's transitions are read in place, as slices of flat arrays. Timezone
+objects are zoneinfo.ZoneInfo instances, built the first time each zone is
+used from the zone's TZif data, stored in the bundle.
+
+Layout, integers in the byte order of the machine that built it, each section
+starting at a multiple of 8 bytes:
+
+    header          HEADER
+    names           the zones then the extra DB files, "\\n"-separated, UTF-8
+    time_starts     (zone_count + 1) int64: zone i's transition times are
+                    times[time_starts[i]:time_starts[i + 1]]
+    times           time_count int64, in POSIX seconds
+    offsets         (time_count + zone_count) int64: zone i's offsets are
+                    offsets[time_starts[i] + i:time_starts[i + 1] + i + 1]
+    data_starts     (len(names) + 1) int64: file i's contents are
+                    data[data_starts[i]:data_starts[i + 1]]
+    data            the zones' TZif files, then the extra DB files
+"""
+
+import io
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo
+
+from .base import TimeZoneBackend, TimeZoneNotFoundError
+from .tzif import TZifError, read_tzif
+
+MAGIC = b"TZFB"
+FORMAT_VERSION = 1
+BYTE_ORDER = b"<" if sys.byteorder == "little" else b">"
+
+# magic, format version, byte order, zone_count, file_count, names_size, time_count, data_size
+HEADER = struct.Struct("<4sHcxIIIIQ")
+
+# DB files other than the zones' TZif files used by the backends, eg: for links
+EXTRA_FILES = ("tzdata.zi", "zone1970.tab", "zone.tab")
+
+
+class BundleError(ValueError):
+    pass
+
+
+def build_bundle(path, tzstrs=None):
+    """
+    Write a bundle of the timezones tzstrs (default: every available one),
+    read from the timezone DB used by zoneinfo, to `path`. Timezones missing
+    from the DB are left out. Returns the number of timezones written.
+    """
+    from .zoneinfo import available_timezones, open_tzfile  # pylint: disable=import-outside-toplevel
+
+    tzstrs = sorted(available_timezones() if tzstrs is None else tzstrs)
+    zones, files = [], []
+    time_starts, times, offsets = array("q", [0]), array("q"), array("q")
+    data_starts, data = array("q", [0]), bytearray()
+
+    for tzstr in tzstrs:
+        try:
+            with open_tzfile(tzstr) as fobj:
+                raw = fobj.read()
+            zone_times, zone_offsets = read_tzif(io.BytesIO(raw))
+        except (TimeZoneNotFoundError, TZifError):
+            continue
+        zones.append(tzstr)
+        times.extend(zone_times)
+        offsets.extend(iter(zone_offsets))
+        time_starts.append(len(times))
+        data += raw
+        data_starts.append(len(data))
+
+    for name in EXTRA_FILES:
+        try:
+            with open_tzfile(name) as fobj:
+                data += fobj.read()
+        except TimeZoneNotFoundError:
+            continue
+        files.append(name)
+        data_starts.append(len(data))
+
+    names = "\n".join(zones + files).encode("utf-8")
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, BYTE_ORDER, len(zones), len(files), len(names), len(times), len(data))
+    sections = [header, names, time_starts.tobytes(), times.tobytes(), offsets.tobytes(), data_starts.tobytes(), data]
+
+    # written to a temporary file renamed into place: processes may have the
+    # current bundle mapped
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fobj:
+            for section in sections:
+                fobj.write(section)
+                fobj.write(b"\0" * (-len(section) % 8))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(zones)
+
+
+class Bundle:
+    "A bundle file, memory mapped, see the module docstring for its layout"
+
+    def __init__(self, path):
+        with open(path, "rb") as fobj:
+            self.mmap = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self.mmap)
+        if len(view) < HEADER.size:
+            raise BundleError(f"Invalid timezone bundle {path}: too short")
+        magic, version, byte_order, zone_count, file_count, names_size, time_count, data_size = HEADER.unpack_from(view)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise BundleError(f"Invalid timezone bundle {path}: unknown format")
+        if byte_order != BYTE_ORDER:
+            raise BundleError(f"Timezone bundle {path} was built on a machine of another byte order")
+
+        position = HEADER.size
+
+        def section(size):
+            nonlocal position
+            start, end = position, position + size
+            position = end + -size % 8
+            if position > len(view):
+                raise BundleError(f"Invalid timezone bundle {path}: truncated")
+            return view[start:end]
+
+        names = bytes(section(names_size)).decode("utf-8").split("\n") if names_size else []
+        if len(names) != zone_count + file_count:
+            raise BundleError(f"Invalid timezone bundle {path}: bad names")
+        self.zone_count = zone_count
+        self.names = tuple(names)
+        self.indexes = {name: i for i, name in enumerate(names)}
+        self.time_starts = section(8 * (zone_count + 1)).cast("q")
+        self.times = section(8 * time_count).cast("q")
+        self.offsets = section(8 * (time_count + zone_count)).cast("q")
+        self.data_starts = section(8 * (len(names) + 1)).cast("q")
+        self.data = section(data_size)
+
+    @property
+    def zone_names(self):
+        return self.names[: self.zone_count]
+
+    def zone_index(self, tzstr):
+        index = self.indexes.get(tzstr)
+        if index is None or index >= self.zone_count:
+            raise TimeZoneNotFoundError
+        return index
+
+    def file_data(self, name):
+        "The contents of the zone or extra DB file `name`, as a memoryview"
+        index = self.indexes.get(name)
+        if index is None:
+            raise TimeZoneNotFoundError
+        start, end = self.data_starts[index], self.data_starts[index + 1]
+        return self.data[start:end]
+
+    def transitions(self, tzstr):
+        index = self.zone_index(tzstr)
+        start, end = self.time_starts[index], self.time_starts[index + 1]
+        # one more offset than times per zone: the offset before the first
+        offsets_start, offsets_end = start + index, end + index + 1
+        return self.times[start:end], self.offsets[offsets_start:offsets_end]
+
+
+def _unpickle(key):
+    from . import get_tz_backend  # pylint: disable=import-outside-toplevel
+
+    tz_backend = get_tz_backend(False)
+    if isinstance(tz_backend, BundleBackend):
+        return tz_backend.to_tzobj(key)
+    return zoneinfo.ZoneInfo(key)
+
+
+class BundleZoneInfo(zoneinfo.ZoneInfo):
+    "A ZoneInfo built from a bundle, pickled by key like the ZoneInfo objects of the DB"
+
+    def __reduce__(self):
+        return (_unpickle, (self.key,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class BundleBackend(TimeZoneBackend):
+    def __init__(self, path):
+        self.bundle = Bundle(path)
+        self.all_tzstrs = self.base_tzstrs = frozenset(self.bundle.zone_names)
+        # tzstr -> BundleZoneInfo, one per zone, as ZoneInfo objects compare by identity
+        self.zones = {}
+        super().__init__()
+        self.utc_tzobj = self.to_tzobj("UTC") if "UTC" in self.all_tzstrs else zoneinfo.ZoneInfo("UTC")
+
+    def is_tzobj(self, value):
+        return isinstance(value, zoneinfo.ZoneInfo)
+
+    def to_tzobj(self, tzstr):
+        try:
+            return self.zones[tzstr]
+        except KeyError:
+            pass
+        return self.zones.setdefault(tzstr, self.build_tzobj(tzstr))
+
+    def build_tzobj(self, tzstr):
+        self.bundle.zone_index(tzstr)
+        with io.BytesIO(self.bundle.file_data(tzstr)) as fobj:
+            return BundleZoneInfo.from_file(fobj, key=tzstr)
+
+    def open_db_file(self, name):
+        return io.BytesIO(self.bundle.file_data(name))
+
+    def load_transitions(self, tzstr):
+        return self.bundle.transitions(tzstr)
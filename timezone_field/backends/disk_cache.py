@@ -0,0 +1,68 @@
+"""
+Small JSON files caching data that's slow to compute from the installed
+timezone DB, shared by every process on the machine.
+
+Disabled unless the TIMEZONE_FIELD_CACHE_DIR setting names a directory.
+"""
+
+import json
+import os
+import tempfile
+
+from django.conf import settings
+
+# bump when the format of any cached value changes
+CACHE_VERSION = 1
+
+
+def get_cache_dir():
+    return getattr(settings, "TIMEZONE_FIELD_CACHE_DIR", None)
+
+
+def load_cached(name, key, build):
+    """
+    Return the value cached under `name` if it was stored with the same `key`,
+    otherwise call `build()` and cache its result.
+
+    `key` and the value must be JSON serializable. Failing to read or write the
+    cache is not an error: the value is just built instead.
+    """
+    cache_dir = get_cache_dir()
+    if not cache_dir:
+        return build()
+
+    key = [CACHE_VERSION, key]
+    path = os.path.join(cache_dir, f"{name}.json")
+    try:
+        with open(path, encoding="utf-8") as fobj:
+            cached = json.load(fobj)
+        if cached["key"] == json.loads(json.dumps(key)):
+            return cached["value"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    value = build()
+    write_atomic(path, {"key": key, "value": value})
+    return value
+
+
+def write_atomic(path, data):
+    """
+    Write `data` as JSON to `path` through a temporary file renamed into place,
+    so concurrent readers only ever see a complete file.
+    """
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fobj:
+            json.dump(data, fobj)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
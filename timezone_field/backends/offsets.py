@@ -0,0 +1,94 @@
+import math
+from array import array
+from bisect import bisect_right
+
+# numpy is optional, it makes batched lookups faster. It's imported the first
+# time an OffsetTable is built, as it takes longer to import than this package.
+NOT_IMPORTED = object()
+numpy = NOT_IMPORTED
+
+# Transition times are clamped to [-SPAN / 2, SPAN / 2) seconds around the
+# epoch (~1100 years either way) so that, with numpy, each zone's times can be
+# shifted into their own disjoint range of a single sorted array.
+SPAN = 2**36
+
+
+def import_numpy():
+    "numpy if it's installed, else None"
+    global numpy  # pylint: disable=global-statement
+    if numpy is NOT_IMPORTED:
+        try:
+            import numpy as module  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            module = None
+        numpy = module
+    return numpy
+
+
+class OffsetTable:
+    """
+    The UTC offset history of a list of timezones, stored as flat arrays.
+
+    Answers "what is the offset of every timezone at instant T" (and "when is
+    each one's next transition") with a binary search per timezone, or a single
+    vectorized search over all of them when numpy is installed.
+
+    `transitions` is a list of (times, offsets) for each timezone, as returned by
+    TimeZoneBackend.transitions().
+    """
+
+    def __init__(self, transitions):
+        self.numpy = numpy = import_numpy()
+        self.times = array("q")
+        self.offsets = array("l")
+        # timezone i's times are self.times[starts[i]:starts[i + 1]] and its
+        # offsets are self.offsets[starts[i] + i:starts[i + 1] + i + 1]
+        self.starts = array("q", [0])
+        for times, offsets in transitions:
+            self.times.extend(times)
+            self.offsets.extend(offsets)
+            self.starts.append(len(self.times))
+
+        if numpy is not None:
+            zone_indexes = numpy.repeat(numpy.arange(len(transitions)), numpy.diff(self.starts))
+            self._np_keys = numpy.clip(numpy.array(self.times, dtype=numpy.int64), -SPAN // 2, SPAN // 2 - 1)
+            self._np_keys += zone_indexes * SPAN
+            self._np_zone_offsets = numpy.arange(len(transitions), dtype=numpy.int64) * SPAN
+            self._np_times = numpy.array(self.times, dtype=numpy.int64)
+            self._np_offsets = numpy.array(self.offsets, dtype=numpy.int64)
+            self._np_ends = numpy.array(self.starts[1:], dtype=numpy.int64)
+
+    def __len__(self):
+        return len(self.starts) - 1
+
+    def _np_search(self, timestamp):
+        timestamp = min(max(math.floor(timestamp), -SPAN // 2), SPAN // 2 - 1)
+        return self.numpy.searchsorted(self._np_keys, self._np_zone_offsets + timestamp, side="right")
+
+    def offset_at(self, index, timestamp):
+        "UTC offset, in seconds, of timezone `index` at the POSIX `timestamp`"
+        i = bisect_right(self.times, timestamp, self.starts[index], self.starts[index + 1])
+        return self.offsets[i + index]
+
+    def next_transition(self, index, timestamp):
+        "POSIX timestamp of timezone `index`'s first transition after `timestamp`, or None"
+        i = bisect_right(self.times, timestamp, self.starts[index], self.starts[index + 1])
+        return self.times[i] if i < self.starts[index + 1] else None
+
+    def offsets_at(self, timestamp):
+        "List of the UTC offsets, in seconds, of every timezone at the POSIX `timestamp`"
+        if self.numpy is not None:
+            positions = self._np_search(timestamp)
+            return self._np_offsets[positions + self.numpy.arange(len(self))].tolist()
+        return [self.offset_at(index, timestamp) for index in range(len(self))]
+
+    def next_transitions(self, timestamp):
+        "List of every timezone's first transition after `timestamp`, None if it has none"
+        if self.numpy is not None:
+            if not self.times:
+                return [None] * len(self)
+            positions = self._np_search(timestamp)
+            times = self._np_times[self.numpy.minimum(positions, len(self.times) - 1)].tolist()
+            has_next = (positions < self._np_ends).tolist()
+            return [time if has_next else None for time, has_next in zip(times, has_next)]
+        return [self.next_transition(index, timestamp) for index in range(len(self))]
@@ -1,4 +1,8 @@
+import calendar
+from array import array
+
 import pytz
+import pytz.tzfile
 
 from .base import TimeZoneBackend, TimeZoneNotFoundError
 
@@ -16,3 +20,26 @@ class PYTZBackend(TimeZoneBackend):
             return pytz.timezone(tzstr)
         except pytz.UnknownTimeZoneError as err:
             raise TimeZoneNotFoundError from err
+
+    def build_tzobj(self, tzstr):
+        # the name's canonical capitalization, as pytz.timezone() accepts any
+        tzstr = str(self.to_tzobj(tzstr))
+        with self.open_db_file(tzstr) as fobj:
+            return pytz.tzfile.build_tzinfo(tzstr, fobj)
+
+    def open_db_file(self, name):
+        try:
+            return pytz.open_resource(name)
+        except OSError as err:
+            raise TimeZoneNotFoundError from err
+
+    def load_transitions(self, tzstr):
+        tzobj = self.to_tzobj(tzstr)
+        if not isinstance(tzobj, pytz.tzinfo.DstTzInfo):
+            return array("q"), array("l", [int(tzobj.utcoffset(None).total_seconds())])
+        # pylint: disable=protected-access
+        times = array("q", (calendar.timegm(time.timetuple()) for time in tzobj._utc_transition_times))
+        offsets = array("l", (int(utcoffset.total_seconds()) for utcoffset, _, _ in tzobj._transition_info))
+        # pytz uses its first offset for times before its first transition too
+        offsets.insert(0, offsets[0])
+        return times, offsets
@@ -0,0 +1,38 @@
+"""
+Readers for the text tables shipped alongside the compiled IANA timezone DB,
+by both the tzdata package and pytz, and in most system zoneinfo directories.
+"""
+
+
+def read_links(fobj):
+    """
+    Read the links (backward compatible names, eg: US/Eastern) of the binary
+    tzdata.zi file object `fobj`.
+
+    Returns a dict of link name -> canonical timezone name.
+    """
+    links = {}
+    for line in fobj:
+        if line.startswith(b"L "):
+            _, target, name = line.split()
+            links[name.decode("ascii")] = target.decode("ascii")
+    # a link may target another link
+    for name, target in links.items():
+        seen = {name}
+        while target in links and target not in seen:
+            seen.add(target)
+            target = links[target]
+        links[name] = target
+    return links
+
+
+def read_zone_tab(fobj):
+    """
+    Read the timezone names of the binary zone1970.tab or zone.tab file object
+    `fobj`, the timezones people are expected to choose from.
+    """
+    tzstrs = []
+    for line in fobj:
+        if not line.startswith(b"#") and line.strip():
+            tzstrs.append(line.split(b"\t")[2].strip().decode("ascii"))
+    return tzstrs
@@ -0,0 +1,148 @@
+"""
+Reader for TZif files (RFC 8536), the compiled format of the IANA timezone DB
+used by zoneinfo and the tzdata package.
+
+Only what's needed to know a zone's UTC offset at any instant is read: the
+transition times and the offset in effect after each. The POSIX TZ string in the
+footer, which describes transitions after the last one listed in the file, is
+expanded into explicit transitions up to TRANSITIONS_UNTIL_YEAR.
+"""
+
+import calendar
+import datetime
+import re
+import struct
+from array import array
+
+# matches the extent of pytz's transition tables
+TRANSITIONS_UNTIL_YEAR = 2037
+
+TZ_STRING_RE = re.compile(
+    r"""
+    (?P<std>[^<0-9:.+-]+|<[a-zA-Z0-9+-]+>)
+    (?P<stdoff>[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?)?
+    (?:
+        (?P<dst>[^<0-9:.,+-]+|<[a-zA-Z0-9+-]+>)
+        (?P<dstoff>[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?)?
+        ,(?P<start>[^,/]+)(?:/(?P<starttime>[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?))?
+        ,(?P<end>[^,/]+)(?:/(?P<endtime>[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?))?
+    )?
+    """,
+    re.ASCII | re.VERBOSE,
+)
+
+
+class TZifError(ValueError):
+    pass
+
+
+def read_tzif(fobj):
+    """
+    Read the TZif data in the binary file object `fobj`.
+
+    Returns (times, offsets): `times` are the transition instants in POSIX
+    seconds, ascending, and `offsets` the UTC offsets in seconds, with
+    offsets[0] in effect before times[0] and offsets[i + 1] from times[i] on.
+    """
+    version, counts = _read_header(fobj)
+    if version >= 2:
+        # skip the v1 data block, the v2+ one that follows has 64 bit times
+        isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+        fobj.seek(timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt, 1)
+        version, counts = _read_header(fobj)
+        time_format, time_size = "q", 8
+    else:
+        time_format, time_size = "l", 4
+
+    isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+    times = struct.unpack(f">{timecnt}{time_format}", fobj.read(timecnt * time_size))
+    type_indices = struct.unpack(f">{timecnt}B", fobj.read(timecnt))
+    types = [struct.unpack(">lbb", fobj.read(6)) for _ in range(typecnt)]
+    if not types:
+        raise TZifError("No time zone information found")
+
+    tz_string = b""
+    if version >= 2:
+        fobj.seek(charcnt + leapcnt * (time_size + 4) + isstdcnt + isutcnt, 1)
+        footer = fobj.read().split(b"\n")
+        tz_string = footer[1] if len(footer) > 2 else b""
+
+    # before the first transition, same as zoneinfo: the first standard time type
+    before = next((utoff for utoff, isdst, _ in types if not isdst), types[0][0])
+    offsets = [before] + [types[i][0] for i in type_indices]
+    times = list(times)
+    if tz_string:
+        _extend_from_tz_string(times, offsets, tz_string.decode("ascii"))
+    elif not times:
+        offsets = [types[-1][0]]
+    return array("q", times), array("l", offsets)
+
+
+def _read_header(fobj):
+    header = fobj.read(44)
+    if len(header) != 44 or header[:4] != b"TZif":
+        raise TZifError("Invalid TZif file: magic not found")
+    version = 1 if header[4:5] == b"\x00" else int(header[4:5])
+    return version, struct.unpack(">6l", header[20:44])
+
+
+def _parse_seconds(value, default=None):
+    "Parse a POSIX TZ string time ([+-]hh[:mm[:ss]]) into seconds"
+    if value is None:
+        return default
+    sign = -1 if value.startswith("-") else 1
+    parts = [int(part) for part in value.lstrip("+-").split(":")]
+    parts += [0] * (3 - len(parts))
+    return sign * (parts[0] * 3600 + parts[1] * 60 + parts[2])
+
+
+def _rule_date(rule, year):
+    "The date a POSIX TZ string rule (Jn, n or Mm.w.d) falls on in `year`"
+    if rule.startswith("M"):
+        month, week, weekday = (int(part) for part in rule[1:].split("."))
+        # weekday: 0 is Sunday
+        first_weekday = (datetime.date(year, month, 1).weekday() + 1) % 7
+        day = 1 + (weekday - first_weekday) % 7 + (week - 1) * 7
+        days_in_month = calendar.monthrange(year, month)[1]
+        while day > days_in_month:
+            day -= 7
+        return datetime.date(year, month, day)
+    if rule.startswith("J"):
+        # 1-365, February 29th is never counted
+        day = int(rule[1:])
+        if calendar.isleap(year) and day >= 60:
+            day += 1
+        return datetime.date(year, 1, 1) + datetime.timedelta(days=day - 1)
+    # 0-365, February 29th is counted
+    return datetime.date(year, 1, 1) + datetime.timedelta(days=int(rule))
+
+
+def _extend_from_tz_string(times, offsets, tz_string):
+    match = TZ_STRING_RE.fullmatch(tz_string)
+    if match is None:
+        raise TZifError(f"Invalid TZ string: {tz_string}")
+    # POSIX offsets are positive west of Greenwich
+    std_offset = -_parse_seconds(match.group("stdoff"), 0)
+    if not times:
+        offsets[:] = [std_offset]
+    if match.group("dst") is None:
+        return
+
+    dst_offset = -_parse_seconds(match.group("dstoff"), -std_offset - 3600)
+    start_time = _parse_seconds(match.group("starttime"), 7200)
+    end_time = _parse_seconds(match.group("endtime"), 7200)
+    epoch = datetime.date(1970, 1, 1)
+
+    first_year = (epoch + datetime.timedelta(seconds=times[-1])).year if times else 1900
+    transitions = []
+    for year in range(first_year, TRANSITIONS_UNTIL_YEAR + 1):
+        # transition times are in local time, of the offset in effect before them
+        start = (_rule_date(match.group("start"), year) - epoch).days * 86400 + start_time - std_offset
+        end = (_rule_date(match.group("end"), year) - epoch).days * 86400 + end_time - dst_offset
+        transitions += [(start, dst_offset), (end, std_offset)]
+
+    last = times[-1] if times else None
+    for time, offset in sorted(transitions):
+        if last is None or time > last:
+            times.append(time)
+            offsets.append(offset)
@@ -1,19 +1,89 @@
+import os
+from functools import lru_cache
+
 try:
     import zoneinfo
 except ImportError:
     from backports import zoneinfo
 
+try:
+    from importlib.resources import files as resource_files
+except ImportError:  # python < 3.9
+    from importlib.resources import open_binary
+else:
+
+    def open_binary(package, resource):
+        return resource_files(package).joinpath(resource).open("rb")
+
+
 from .base import TimeZoneBackend, TimeZoneNotFoundError
+from .disk_cache import load_cached
+from .tzif import read_tzif
 
 
-class ZoneInfoBackend(TimeZoneBackend):
-    utc_tzobj = zoneinfo.ZoneInfo("UTC")
-    all_tzstrs = zoneinfo.available_timezones()
-    base_tzstrs = zoneinfo.available_timezones()
+def open_tzfile(key):
+    "Open the TZif file for key, looking in the same places as zoneinfo.ZoneInfo"
+    for path in zoneinfo.TZPATH:
+        filepath = os.path.join(path, *key.split("/"))
+        if os.path.isfile(filepath):
+            return open(filepath, "rb")  # pylint: disable=consider-using-with
+    *package, resource = key.split("/")
+    try:
+        return open_binary(".".join(["tzdata", "zoneinfo", *package]), resource)
+    except (ImportError, FileNotFoundError, UnicodeEncodeError) as err:
+        raise TimeZoneNotFoundError from err
+
+
+def tzdb_version_key():
+    """
+    Identifies the installed timezone DB: the tzdata package version and the
+    modification time of every directory on the TZPATH.
+    """
+    try:
+        import tzdata  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        tzdata_version = None
+    else:
+        tzdata_version = getattr(tzdata, "__version__", None)
+    tzpath_mtimes = []
+    for path in zoneinfo.TZPATH:
+        try:
+            tzpath_mtimes.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            continue
+    return [tzdata_version, tzpath_mtimes]
+
+
+def scan_timezones():
+    tzstrs = zoneinfo.available_timezones()
     # Remove the "Factory" timezone as it can cause ValueError exceptions on
     # some systems, e.g. FreeBSD, if the system zoneinfo database is used.
-    all_tzstrs.discard("Factory")
-    base_tzstrs.discard("Factory")
+    tzstrs.discard("Factory")
+    return sorted(tzstrs)
+
+
+@lru_cache(maxsize=None)
+def available_timezones():
+    """
+    zoneinfo.available_timezones(), computed at most once per process as it
+    walks every directory on the TZPATH and the tzdata package.
+
+    With the TIMEZONE_FIELD_CACHE_DIR setting, the result is also saved there
+    and reused by other processes until the timezone DB changes.
+    """
+    return frozenset(load_cached("zoneinfo-tzstrs", tzdb_version_key(), scan_timezones))
+
+
+class ZoneInfoBackend(TimeZoneBackend):
+    utc_tzobj = zoneinfo.ZoneInfo("UTC")
+
+    @property
+    def all_tzstrs(self):
+        return available_timezones()
+
+    @property
+    def base_tzstrs(self):
+        return available_timezones()
 
     def is_tzobj(self, value):
         return isinstance(value, zoneinfo.ZoneInfo)
@@ -25,3 +95,15 @@ class ZoneInfoBackend(TimeZoneBackend):
             return zoneinfo.ZoneInfo(tzstr)
         except zoneinfo.ZoneInfoNotFoundError as err:
             raise TimeZoneNotFoundError from err
+
+    def build_tzobj(self, tzstr):
+        self.to_tzobj(tzstr)  # validate the key
+        return zoneinfo.ZoneInfo.no_cache(tzstr)
+
+    def open_db_file(self, name):
+        return open_tzfile(name)
+
+    def load_transitions(self, tzstr):
+        self.to_tzobj(tzstr)  # validate the key
+        with open_tzfile(tzstr) as fobj:
+            return read_tzif(fobj)
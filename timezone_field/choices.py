@@ -1,7 +1,236 @@
+import bisect
 import datetime
+import math
+import threading
+import time
+from collections.abc import Iterable
+from functools import lru_cache
 
+from django.utils.functional import cached_property
+
+from timezone_field import instrumentation
 from timezone_field.backends import get_tz_backend
 
+try:
+    from django.utils.choices import BaseChoiceIterator
+except ImportError:  # django < 5.0
+    BaseChoiceIterator = object
+
+
+class FrozenChoices(BaseChoiceIterator):
+    """
+    An immutable sequence of (value, display) choices, stored as two parallel
+    tuples. Instances are shared between fields, see `get_choices`.
+
+    `expires` is the POSIX timestamp after which the displays are out of date
+    (eg: GMT offsets after a DST transition), or None if they never are.
+    """
+
+    def __init__(self, values, displays, expires=None):
+        self.values = tuple(values)
+        self.displays = tuple(displays)
+        self.expires = expires
+
+    @classmethod
+    def from_pairs(cls, choices):
+        return cls(*zip(*choices)) if choices else cls((), ())
+
+    @cached_property
+    def value_index(self):
+        # timezones are looked up by name: the same zone can be represented by
+        # distinct objects (eg: pytz's per-offset tzinfo instances)
+        return frozenset(str(value) for value in self.values)
+
+    def has_value(self, value):
+        return str(value) in self.value_index
+
+    def is_expired(self):
+        return self.expires is not None and time.time() >= self.expires
+
+    def __iter__(self):
+        return zip(self.values, self.displays)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(zip(self.values[index], self.displays[index]))
+        return (self.values[index], self.displays[index])
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        if isinstance(other, Iterable) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+class LazyChoices(BaseChoiceIterator):
+    """
+    A read-only sequence of choices, built by calling `build` the first time
+    it's used, and again whenever the built FrozenChoices expire.
+
+    Building the choices for a field means loading every timezone object and
+    sorting them, so it's deferred until something (validation, a form, the
+    admin, a migration) actually needs them.
+    """
+
+    def __init__(self, build):
+        self._build = build
+        self._choices = None
+
+    def _get_choices(self):
+        choices = self._choices
+        if choices is None or choices.is_expired():
+            with instrumentation.timed("choices.build"):
+                choices = self._choices = self._build()
+        return choices
+
+    @property
+    def is_built(self):
+        return self._choices is not None
+
+    @property
+    def frozen(self):
+        "The FrozenChoices currently backing these choices, built if needed"
+        return self._get_choices()
+
+    def __iter__(self):
+        return iter(self._get_choices())
+
+    def __len__(self):
+        return len(self._get_choices())
+
+    def __getitem__(self, index):
+        return self._get_choices()[index]
+
+    @property
+    def value_index(self):
+        return self._get_choices().value_index
+
+    def has_value(self, value):
+        return self._get_choices().has_value(value)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyChoices):
+            other = other._get_choices()
+        if isinstance(other, Iterable) and not isinstance(other, str):
+            return self._get_choices() == other
+        return NotImplemented
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # read-only, so copies (eg: one per form instance) can share it
+        return self
+
+
+class GMTOffsetChoices:
+    """
+    Keeps the "WITH_GMT_OFFSET" choices for a list of timezones up to date.
+
+    The choices are valid until the earliest upcoming offset transition among
+    the timezones. Past that, only the timezones whose transition has passed
+    are recomputed and moved to their new position in the ordering.
+    """
+
+    def __init__(self, timezones, use_pytz=None):
+        self.tz_backend = get_tz_backend(use_pytz)
+        self.timezones = tuple(timezones)
+        self.offset_table = self.tz_backend.offset_table([str(tz) for tz in self.timezones])
+        self.offsets = [None] * len(self.timezones)
+        self.displays = [None] * len(self.timezones)
+        self.next_transitions = [None] * len(self.timezones)
+        # (offset in seconds, index) for every timezone, sorted
+        self.ordering = []
+        self.valid_from = None
+        self.expires = None
+        self.choices = None
+        self.lock = threading.Lock()
+
+    def get(self, now=None):
+        timestamp = (now or datetime.datetime.now(self.tz_backend.utc_tzobj)).timestamp()
+        choices = self.choices
+        if choices is not None and self.valid_from <= timestamp < self.expires:
+            return choices
+        with self.lock, instrumentation.timed("choices.gmt_offset", timezones=len(self.timezones)):
+            return self._update(timestamp)
+
+    def _update(self, timestamp):
+        if self.choices is None or timestamp < self.valid_from:
+            stale = range(len(self.timezones))
+            offsets = self.offset_table.offsets_at(timestamp)
+            next_transitions = self.offset_table.next_transitions(timestamp)
+        elif timestamp < self.expires:
+            return self.choices
+        else:
+            stale = [i for i, next_transition in enumerate(self.next_transitions) if next_transition <= timestamp]
+            offsets = {i: self.offset_table.offset_at(i, timestamp) for i in stale}
+            next_transitions = {i: self.offset_table.next_transition(i, timestamp) for i in stale}
+
+        for i in stale:
+            next_transition = next_transitions[i]
+            self.next_transitions[i] = math.inf if next_transition is None else next_transition
+            offset = offsets[i]
+            if offset == self.offsets[i]:
+                continue
+            if self.offsets[i] is not None:
+                del self.ordering[bisect.bisect_left(self.ordering, (self.offsets[i], i))]
+            bisect.insort(self.ordering, (offset, i))
+            self.offsets[i] = offset
+            self.displays[i] = gmt_offset_display(offset, str(self.timezones[i]))
+
+        self.valid_from = timestamp
+        self.expires = min(self.next_transitions, default=math.inf)
+        self.choices = FrozenChoices(
+            [self.timezones[i] for _, i in self.ordering],
+            [self.displays[i] for _, i in self.ordering],
+            expires=None if self.expires == math.inf else self.expires,
+        )
+        return self.choices
+
+
+def get_value_index(choices):
+    """
+    Return a frozenset of the string form of every value in `choices`, for
+    O(1) membership tests. Returns None for other lazy iterators (eg: django's
+    CallableChoiceIterator), whose values may change between uses.
+    """
+    if isinstance(choices, (FrozenChoices, LazyChoices)):
+        return choices.value_index
+    if not isinstance(choices, (list, tuple)):
+        return None
+    values = []
+    for value, display in choices:
+        if isinstance(display, (list, tuple)):
+            # This is an optgroup, so look inside the group for options
+            values.extend(group_value for group_value, _ in display)
+        else:
+            values.append(value)
+    return frozenset(str(value) for value in values)
+
+
+# (timezone backend, choices_display, timezones) -> FrozenChoices or GMTOffsetChoices
+choices_cache = {}
+
+STANDARD_TRANSLATION = str.maketrans({"-": " ", "_": " "})
+
+
+@lru_cache(maxsize=None)
+def standard_sort_key(display):
+    return display.translate(STANDARD_TRANSLATION)
+
 
 def normalize_standard(tztuple):
     """Normalize timezone names by replacing special characters with space.
@@ -10,7 +239,7 @@ def normalize_standard(tztuple):
 
     :param str tztuple: tuple of timezone and representation
     """
-    return tztuple[1].translate(str.maketrans({"-": " ", "_": " "}))
+    return standard_sort_key(tztuple[1])
 
 
 def normalize_gmt(tztuple):
@@ -39,6 +268,15 @@ def standard(timezones):
     return sorted(choices, key=normalize_standard)
 
 
+def gmt_offset_display(offset, tz_str):
+    "Display string for a timezone at an offset in seconds, eg: GMT-05:00 America/New York"
+    return "GMT{sign}{gmt_diff} {timezone}".format(
+        sign="+" if offset >= 0 else "-",
+        gmt_diff=str(datetime.timedelta(seconds=abs(offset))).zfill(8)[:-3],
+        timezone=tz_str.replace("_", " "),
+    )
+
+
 def with_gmt_offset(timezones, now=None, use_pytz=None):
     """
     Given a list of timezones (either strings of timezone objects),
@@ -50,17 +288,37 @@ def with_gmt_offset(timezones, now=None, use_pytz=None):
     """
     tz_backend = get_tz_backend(use_pytz)
     now = now or datetime.datetime.now(tz_backend.utc_tzobj)
-    _choices = []
-    for tz in timezones:
-        tz_str = str(tz)
-        now_tz = now.astimezone(tz_backend.to_tzobj(tz_str))
-        delta = now_tz.replace(tzinfo=tz_backend.utc_tzobj) - now
-        display = "GMT{sign}{gmt_diff} {timezone}".format(
-            sign="+" if delta == abs(delta) else "-",
-            gmt_diff=str(abs(delta)).zfill(8)[:-3],
-            timezone=tz_str.replace("_", " "),
-        )
-        _choices.append((delta, tz, display))
-    _choices.sort(key=lambda x: x[0])
-    choices = [(one, two) for zero, one, two in _choices]
-    return sorted(choices, key=normalize_gmt)
+    timezones = list(timezones)
+    tz_strs = [str(tz) for tz in timezones]
+    offsets = tz_backend.offset_table(tz_strs).offsets_at(now.timestamp())
+    ordering = sorted(range(len(timezones)), key=offsets.__getitem__)
+    return [(timezones[i], gmt_offset_display(offsets[i], tz_strs[i])) for i in ordering]
+
+
+def get_choices(timezones, choices_display=None, use_pytz=None, now=None):
+    """
+    Given a list of timezones (either strings of timezone objects),
+    return the choices built by `standard` (choices_display "STANDARD" or None)
+    or `with_gmt_offset` (choices_display "WITH_GMT_OFFSET") as a FrozenChoices.
+
+    Results are cached for the life of the process, so every field using the
+    same timezones and display shares a single copy of its choices. The
+    "WITH_GMT_OFFSET" choices expire, and are refreshed, when one of the
+    timezones goes through an offset transition.
+    """
+    tz_backend = get_tz_backend(use_pytz)
+    timezones = tuple(timezones)
+    choices_display = choices_display or "STANDARD"
+    key = (tz_backend, choices_display, timezones)
+    choices = choices_cache.get(key)
+    if choices is None:
+        if choices_display == "WITH_GMT_OFFSET":
+            choices = GMTOffsetChoices(timezones, use_pytz=use_pytz)
+        elif choices_display == "STANDARD":
+            choices = FrozenChoices.from_pairs(standard(timezones))
+        else:
+            raise ValueError(f"Unrecognized value for kwarg 'choices_display' of '{choices_display}'")
+        choices = choices_cache.setdefault(key, choices)
+    if isinstance(choices, GMTOffsetChoices):
+        return choices.get(now)
+    return choices
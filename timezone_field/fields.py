@@ -1,10 +1,15 @@
+from functools import partial
+
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.encoding import force_str
 
+from timezone_field import instrumentation
 from timezone_field.backends import TimeZoneNotFoundError, get_tz_backend
-from timezone_field.choices import standard, with_gmt_offset
-from timezone_field.utils import AutoDeserializedAttribute
+from timezone_field.choices import FrozenChoices, LazyChoices, get_choices
+from timezone_field.lookups import CurrentOffset, LocalHour
+from timezone_field.utils import AutoDeserializedAttribute, RawDBValue
+from timezone_field.zone_ids import ZONE_IDS, TimeZoneRef, zone_id, zone_name
 
 
 class TimeZoneField(models.Field):
@@ -31,9 +36,23 @@ class TimeZoneField(models.Field):
     Blank values are stored in the DB as the empty string. Timezones are stored
     in their string representation.
 
+    With `canonicalize=True`, links (eg: US/Eastern) are stored as the
+    timezone they point to (eg: America/New_York).
+
+    With `integer_storage=True`, timezones are stored as SmallIntegers instead,
+    the IDs in timezone_field.zone_ids, and blank values as 0.
+
+    With `lazy_deserialization=True`, values loaded from the DB are kept as
+    strings until the model attribute is first read. Invalid values then only
+    raise when read, and values()/values_list() querysets return the strings.
+
     The `choices` kwarg can be specified as a list of either
     [<timezone object>, <str>] or [<str>, <str>]. Internally in memory, it is
     stored as [<timezone object>, <str>].
+
+    Without `choices`, they default to the backend's base_tzstrs, or with
+    `canonical_choices=True` to its canonical_tzstrs: the zones of the
+    timezone DB's zone1970.tab, without backward compatible links.
     """
 
     descriptor_class = AutoDeserializedAttribute
@@ -54,10 +73,31 @@ class TimeZoneField(models.Field):
 
         self.use_pytz = kwargs.pop("use_pytz", None)
         self.tz_backend = get_tz_backend(self.use_pytz)
-        self.default_tzs = [self.tz_backend.to_tzobj(v) for v in self.tz_backend.base_tzstrs]
 
-        if "choices" in kwargs:
-            values, displays = zip(*kwargs["choices"])
+        self.canonical_choices = kwargs.pop("canonical_choices", False)
+        self.canonicalize = kwargs.pop("canonicalize", False)
+        self.integer_storage = kwargs.pop("integer_storage", False)
+        self.lazy_deserialization = kwargs.pop("lazy_deserialization", False)
+        self.use_refs = kwargs.pop("use_refs", False)
+
+        self.choices_display = kwargs.pop("choices_display", None)
+        if self.choices_display not in (None, "STANDARD", "WITH_GMT_OFFSET"):
+            raise ValueError(f"Unrecognized value for kwarg 'choices_display' of '{self.choices_display}'")
+
+        # Model classes are usually defined at import time, so avoid loading
+        # every timezone object here. Choices are built when first used.
+        kwargs["choices"] = LazyChoices(partial(self._build_choices, kwargs.pop("choices", None)))
+        super().__init__(*args, **kwargs)
+
+    @property
+    def default_tzs(self):
+        if self.canonical_choices:
+            return self.tz_backend.canonical_tzobjs
+        return self.tz_backend.base_tzobjs
+
+    def _build_choices(self, choices):
+        if choices is not None:
+            values, displays = zip(*choices)
             # Choices can be specified in two forms: either
             # [<timezone object>, <str>] or [<str>, <str>]
             #
@@ -76,23 +116,26 @@ class TimeZoneField(models.Field):
             values = self.default_tzs
             displays = None
 
-        self.choices_display = kwargs.pop("choices_display", None)
-        if self.choices_display == "WITH_GMT_OFFSET":
-            choices = with_gmt_offset(values, use_pytz=self.use_pytz)
-        elif self.choices_display == "STANDARD":
-            choices = standard(values)
-        elif self.choices_display is None:
-            choices = zip(values, displays) if displays else standard(values)
-        else:
-            raise ValueError(f"Unrecognized value for kwarg 'choices_display' of '{self.choices_display}'")
-
-        kwargs["choices"] = choices
-        super().__init__(*args, **kwargs)
+        if self.choices_display is None and displays:
+            return FrozenChoices(values, displays)
+        return get_choices(values, self.choices_display, use_pytz=self.use_pytz)
 
     def validate(self, value, model_instance):
+        if isinstance(value, TimeZoneRef):
+            value = value.resolve(self.use_pytz)
         if not self.tz_backend.is_tzobj(value):
             raise ValidationError(f"'{value}' is not a pytz timezone object")
-        super().validate(value, model_instance)
+        if not hasattr(self.choices, "has_value"):
+            # choices were replaced after the field was created
+            super().validate(value, model_instance)
+        elif self.editable and not self.choices.has_value(value):
+            # Same as Field.validate, using a hash lookup rather than a scan of
+            # the choices. Its null/blank checks can't fail for a timezone object.
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
 
     def deconstruct(self):
         name, path, args, kwargs = super().deconstruct()
@@ -102,14 +145,25 @@ class TimeZoneField(models.Field):
         if self.use_pytz is not None:
             kwargs["use_pytz"] = self.use_pytz
 
+        if self.canonical_choices:
+            kwargs["canonical_choices"] = True
+
+        if self.canonicalize:
+            kwargs["canonicalize"] = True
+
+        if self.integer_storage:
+            kwargs["integer_storage"] = True
+
         if self.choices_display is not None:
             kwargs["choices_display"] = self.choices_display
 
+        # lazy_deserialization and use_refs don't affect the DB, leave them out of migrations
+
         # don't assume super().deconstruct() will pass us back our kwargs["choices"]
         # https://github.com/mfogel/django-timezone-field/issues/96
         if "choices" in kwargs:
             if self.choices_display is None:
-                if kwargs["choices"] == standard(self.default_tzs):
+                if kwargs["choices"] == get_choices(self.default_tzs, use_pytz=self.use_pytz):
                     kwargs.pop("choices")
             else:
                 values, _ = zip(*kwargs["choices"])
@@ -126,25 +180,59 @@ class TimeZoneField(models.Field):
         return name, path, args, kwargs
 
     def get_internal_type(self):
-        return "CharField"
+        return "SmallIntegerField" if self.integer_storage else "CharField"
 
     def get_default(self):
         # allow defaults to be still specified as strings. Allows for easy
         # serialization into migration files
         value = super().get_default()
-        return self._get_python_and_db_repr(value)[0]
+        return self.to_python(value)
 
     def from_db_value(self, value, *_args):
         "Convert to pytz timezone object"
+        if self.use_refs and value is not None:
+            # the timezone object is only loaded when resolved
+            if self.integer_storage:
+                return TimeZoneRef(value) if value else None
+            value = force_str(value)
+            if value in ZONE_IDS:
+                return TimeZoneRef(ZONE_IDS[value]) if value else None
+            # eg: another capitalization of a name, accepted by pytz. Names
+            # with no ID, eg: "localtime", raise ValidationError
+            return self.to_python(value)
+        if self.integer_storage and value is not None:
+            value = zone_name(value)
+        if self.lazy_deserialization and value:
+            # converted by AutoDeserializedAttribute when first read
+            return RawDBValue(force_str(value))
         return self._get_python_and_db_repr(value)[0]
 
     def to_python(self, value):
         "Convert to pytz timezone object"
-        return self._get_python_and_db_repr(value)[0]
+        if not self.use_refs:
+            return self._get_python_and_db_repr(value)[0]
+        if isinstance(value, TimeZoneRef):
+            return value
+        tzobj = self._get_python_and_db_repr(value)[0]
+        return None if tzobj is None else TimeZoneRef.for_name(str(tzobj))
+
+    def is_python_value(self, value):
+        "Whether value is of the type returned by to_python(), other than None"
+        if self.use_refs:
+            return isinstance(value, TimeZoneRef)
+        return self.tz_backend.is_tzobj(value)
 
     def get_prep_value(self, value):
         "Convert to string describing a valid pytz timezone object"
-        return self._get_python_and_db_repr(value)[1]
+        if isinstance(value, TimeZoneRef):
+            value = value.name
+        tzobj, value = self._get_python_and_db_repr(value)
+        if tzobj is not None and (self.canonicalize or self.integer_storage):
+            # the zone's own name: pytz also accepts other capitalizations, eg: "us/pacific"
+            value = str(tzobj)
+        if self.canonicalize:
+            value = self.tz_backend.canonicalize(value)
+        return zone_id(value) if self.integer_storage else value
 
     def _get_python_and_db_repr(self, value):
         "Returns a tuple of (python representation, db representation)"
@@ -152,7 +240,13 @@ class TimeZoneField(models.Field):
             return (None, "")
         if self.tz_backend.is_tzobj(value):
             return (value, str(value))
+        value = force_str(value)
         try:
-            return (self.tz_backend.to_tzobj(force_str(value)), force_str(value))
+            return (self.tz_backend.get_tzobj(value), value)
         except TimeZoneNotFoundError as err:
+            instrumentation.record("field.invalid", value=value, field=self)
             raise ValidationError(f"Invalid timezone '{value}'") from err
+
+
+TimeZoneField.register_lookup(CurrentOffset)
+TimeZoneField.register_lookup(LocalHour)
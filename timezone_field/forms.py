@@ -1,15 +1,19 @@
+from functools import partial
+
 from django import forms
 from django.core.exceptions import ValidationError
 
+from timezone_field import instrumentation
 from timezone_field.backends import TimeZoneNotFoundError, get_tz_backend
-from timezone_field.choices import standard, with_gmt_offset
+from timezone_field.choices import FrozenChoices, LazyChoices, get_choices, get_value_index
 
 
 def get_coerce(tz_backend):
     def coerce(val):
         try:
-            return tz_backend.to_tzobj(val)
+            return tz_backend.get_tzobj(val)
         except TimeZoneNotFoundError as err:
+            instrumentation.record("form_field.invalid", value=val)
             raise ValidationError(f"Unknown time zone: '{val}'") from err
 
     return coerce
@@ -22,21 +26,41 @@ class TimeZoneFormField(forms.TypedChoiceField):
         kwargs.setdefault("coerce", get_coerce(self.tz_backend))
         kwargs.setdefault("empty_value", None)
 
+        canonical_choices = kwargs.pop("canonical_choices", False)
         if "choices" in kwargs:
             values, displays = zip(*kwargs["choices"])
+        elif canonical_choices:
+            values = self.tz_backend.canonical_tzstrs
+            displays = None
         else:
             values = self.tz_backend.base_tzstrs
             displays = None
 
         choices_display = kwargs.pop("choices_display", None)
-        if choices_display == "WITH_GMT_OFFSET":
-            choices = with_gmt_offset(values, use_pytz=self.use_pytz)
-        elif choices_display == "STANDARD":
-            choices = standard(values)
-        elif choices_display is None:
-            choices = zip(values, displays) if displays else standard(values)
-        else:
+        if choices_display not in (None, "STANDARD", "WITH_GMT_OFFSET"):
             raise ValueError(f"Unrecognized value for kwarg 'choices_display' of '{choices_display}'")
+        if choices_display is None and displays:
+            choices = FrozenChoices(values, displays)
+        else:
+            choices = LazyChoices(partial(get_choices, values, choices_display, use_pytz=self.use_pytz))
 
         kwargs["choices"] = choices
         super().__init__(*args, **kwargs)
+
+    @property
+    def choices(self):
+        return super().choices
+
+    @choices.setter
+    def choices(self, value):
+        if isinstance(value, (FrozenChoices, LazyChoices)):
+            # already normalized and immutable; don't let django copy it to a list
+            self._choices = self.widget.choices = value
+        else:
+            forms.TypedChoiceField.choices.fset(self, value)
+        self._value_index = get_value_index(self.choices)
+
+    def valid_value(self, value):
+        if self._value_index is None:
+            return super().valid_value(value)
+        return str(value) in self._value_index
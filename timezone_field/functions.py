@@ -0,0 +1,87 @@
+import datetime
+from bisect import bisect_right
+
+from django.core.exceptions import ValidationError
+from django.db import NotSupportedError
+from django.db.models import DateTimeField, Func
+
+from timezone_field.backends import TimeZoneNotFoundError, get_tz_backend
+from timezone_field.backends.tzif import TRANSITIONS_UNTIL_YEAR
+from timezone_field.zone_ids import ZONE_NAMES, zone_name
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+
+class LocalTime(Func):  # pylint: disable=abstract-method
+    """
+    The UTC datetime `expression` in the local time of the timezone in
+    `tz_expression`, typically a TimeZoneField, evaluated in the database for
+    each row. Requires USE_TZ = True.
+
+    The result is the local wall-clock time labelled as UTC: eg: 12:30 UTC in
+    Asia/Tokyo is 21:30+00:00. So with UTC as the current timezone, date
+    lookups, Trunc and Extract on it give local dates and hours.
+
+        Event.objects.annotate(local=LocalTime("created_at", "tz")).filter(local__hour=9)
+
+    Supported on PostgreSQL (AT TIME ZONE) and SQLite (a Python function
+    registered on the connection). Rows with a blank timezone give NULL.
+    """
+
+    arity = 2
+    output_field = DateTimeField()
+
+    def _integer_storage(self):
+        return getattr(self.source_expressions[1].output_field, "integer_storage", False)
+
+    def as_sql(self, compiler, connection, function=None, template=None, arg_joiner=None, **extra_context):
+        if function is None:
+            raise NotSupportedError("LocalTime is only supported on PostgreSQL and SQLite.")
+        return super().as_sql(compiler, connection, function, template, arg_joiner, **extra_context)
+
+    def as_postgresql(self, compiler, connection, **extra_context):  # pylint: disable=unused-argument
+        datetime_sql, datetime_params = compiler.compile(self.source_expressions[0])
+        tz_sql, tz_params = compiler.compile(self.source_expressions[1])
+        if self._integer_storage():
+            tz_sql = f"(%s::text[])[{tz_sql} + 1]"
+            tz_params = (list(ZONE_NAMES), *tz_params)
+        sql = f"(({datetime_sql}) AT TIME ZONE NULLIF({tz_sql}, '')) AT TIME ZONE 'UTC'"
+        return sql, (*datetime_params, *tz_params)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        register_sqlite_functions(connection)
+        return self.as_sql(compiler, connection, function="timezone_field_local_time", **extra_context)
+
+
+def register_sqlite_functions(connection):
+    "Register local_time() on a django SQLite connection, once per DB connection"
+    connection.ensure_connection()
+    if getattr(connection, "timezone_field_functions", None) is not connection.connection:
+        connection.connection.create_function("timezone_field_local_time", 2, local_time, deterministic=True)
+        connection.timezone_field_functions = connection.connection
+
+
+def local_time(value, tz):
+    """
+    SQLite function: the naive UTC datetime string `value` as a naive datetime
+    string in the local time of timezone `tz`, a name or an integer storage ID.
+    None for a NULL datetime or a blank or unknown timezone.
+    """
+    if value is None or tz is None:
+        return None
+    value = datetime.datetime.fromisoformat(value)
+    tz_backend = get_tz_backend(False)
+    try:
+        if isinstance(tz, int):
+            tz = zone_name(tz)
+        if not tz:
+            return None
+        if value.year > TRANSITIONS_UNTIL_YEAR:
+            # past the transition tables
+            utc = value.replace(tzinfo=tz_backend.utc_tzobj)
+            return str(utc.astimezone(tz_backend.to_tzobj(tz)).replace(tzinfo=None))
+        times, offsets = tz_backend.transitions(tz)
+    except (TimeZoneNotFoundError, ValidationError):
+        return None
+    offset = offsets[bisect_right(times, (value - EPOCH).total_seconds())]
+    return str(value + datetime.timedelta(seconds=offset))
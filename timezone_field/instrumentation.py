@@ -0,0 +1,87 @@
+"""
+Counters, timers and hooks observing what the package does at runtime:
+timezone conversions and their cache, choice builds, and invalid values.
+
+Off unless enabled, by the TIMEZONE_FIELD_INSTRUMENTATION setting or
+`enable()`. While off, instrumented code only checks `enabled`.
+
+Events:
+    tzobj_cache.hit         a timezone string found in a backend's cache
+    tzobj_cache.miss        converted by the backend's to_tzobj (timed)
+    tzobj_cache.not_found   to_tzobj raised TimeZoneNotFoundError
+    choices.build           a field's choices built (timed)
+    choices.gmt_offset      "WITH_GMT_OFFSET" choices updated (timed)
+    field.invalid           TimeZoneField got an invalid timezone
+    form_field.invalid      TimeZoneFormField got an invalid timezone
+    serializer_field.invalid    TimeZoneSerializerField got an invalid timezone
+
+Each event increments `counters[event]`, adds its duration in seconds, if
+timed, to `timers[event]`, calls every callback added with `add_callback` as
+`callback(event, duration, info)` and sends the `event_recorded` signal.
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.dispatch import Signal
+
+enabled = getattr(settings, "TIMEZONE_FIELD_INSTRUMENTATION", False)
+
+counters = Counter()
+timers = Counter()
+callbacks = []
+lock = threading.Lock()
+
+# sent with event, duration and info keyword arguments
+event_recorded = Signal()
+
+
+def enable():
+    global enabled  # pylint: disable=global-statement
+    enabled = True
+
+
+def disable():
+    global enabled  # pylint: disable=global-statement
+    enabled = False
+
+
+def reset():
+    with lock:
+        counters.clear()
+        timers.clear()
+
+
+def add_callback(callback):
+    callbacks.append(callback)
+
+
+def remove_callback(callback):
+    callbacks.remove(callback)
+
+
+def record(event, duration=None, **info):
+    "Record an occurrence of `event`, if enabled"
+    if not enabled:
+        return
+    with lock:
+        counters[event] += 1
+        if duration is not None:
+            timers[event] += duration
+    for callback in list(callbacks):
+        callback(event, duration, info)
+    event_recorded.send(sender=None, event=event, duration=duration, info=info)
+
+
+@contextmanager
+def timed(event, **info):
+    "Record `event` with the duration of the block, if enabled"
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    yield
+    record(event, time.perf_counter() - start, **info)
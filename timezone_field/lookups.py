@@ -0,0 +1,157 @@
+import datetime
+import math
+import threading
+import time
+from functools import lru_cache, reduce
+from operator import or_
+
+from django.db.models import Lookup, Q
+from django.db.models.lookups import In
+
+from timezone_field.zone_ids import ZONE_IDS
+
+
+@lru_cache(maxsize=None)
+def all_zones_offset_table(tz_backend):
+    "(timezone names, OffsetTable) of all of a backend's timezones"
+    tzstrs = tuple(sorted(tz_backend.all_tzstrs))
+    return tzstrs, tz_backend.offset_table(tzstrs)
+
+
+class OffsetGroups:
+    """
+    Every timezone of a backend, grouped by UTC offset at a given instant.
+
+    The groups stay valid until the earliest upcoming offset transition among
+    the timezones, so they're only recomputed a few times a week.
+    """
+
+    def __init__(self, tz_backend):
+        self.tz_backend = tz_backend
+        # (groups, valid from, expires), replaced all at once
+        self.state = None
+        self.lock = threading.Lock()
+
+    def get(self, timestamp):
+        "Dict of UTC offset in seconds -> tuple of timezone names at the POSIX `timestamp`"
+        state = self.state
+        if state is not None and state[1] <= timestamp < state[2]:
+            return state[0]
+        with self.lock:
+            tzstrs, offset_table = all_zones_offset_table(self.tz_backend)
+            groups = {}
+            for tzstr, offset in zip(tzstrs, offset_table.offsets_at(timestamp)):
+                groups.setdefault(offset, []).append(tzstr)
+            next_transitions = [t for t in offset_table.next_transitions(timestamp) if t is not None]
+            groups = {offset: tuple(tzstrs) for offset, tzstrs in groups.items()}
+            self.state = (groups, timestamp, min(next_transitions, default=math.inf))
+            return groups
+
+
+# timezone backend -> OffsetGroups
+offset_groups_cache = {}
+
+
+def get_offset_groups(tz_backend, timestamp):
+    offset_groups = offset_groups_cache.get(tz_backend)
+    if offset_groups is None:
+        offset_groups = offset_groups_cache.setdefault(tz_backend, OffsetGroups(tz_backend))
+    return offset_groups.get(timestamp)
+
+
+class OffsetGroupLookup(Lookup):  # pylint: disable=abstract-method
+    """
+    Base for lookups matching the timezones in some of the current offset
+    groups. They compile to an IN-list of timezone names, which can use an
+    index on the column.
+    """
+
+    prepare_rhs = False
+
+    def get_tzstrs(self, groups, timestamp):
+        raise NotImplementedError
+
+    def as_sql(self, compiler, connection):
+        field = self.lhs.output_field
+        timestamp = time.time()
+        tzstrs = self.get_tzstrs(get_offset_groups(field.tz_backend, timestamp), timestamp)
+        if field.integer_storage:
+            # can't be stored, eg: a system's "localtime"
+            tzstrs = [tzstr for tzstr in tzstrs if tzstr in ZONE_IDS]
+        return In(self.lhs, tzstrs).as_sql(compiler, connection)
+
+
+class CurrentOffset(OffsetGroupLookup):  # pylint: disable=abstract-method
+    "tz__current_offset=timedelta(hours=9): timezones currently at the UTC offset"
+
+    lookup_name = "current_offset"
+
+    def get_tzstrs(self, groups, timestamp):
+        return list(groups.get(int(self.rhs.total_seconds()), ()))
+
+
+class LocalHour(OffsetGroupLookup):  # pylint: disable=abstract-method
+    "tz__local_hour=9: timezones where it's currently 9 o'clock"
+
+    lookup_name = "local_hour"
+
+    def get_tzstrs(self, groups, timestamp):
+        return [
+            tzstr
+            for offset, tzstrs in groups.items()
+            if int((timestamp + offset) // 3600) % 24 == self.rhs
+            for tzstr in tzstrs
+        ]
+
+
+@lru_cache(maxsize=128)
+def local_date_windows(tz_backend, date):
+    """
+    The UTC [start, end) POSIX timestamps of `date` in each of a backend's
+    timezones, as a tuple of ((start, end), timezone names), grouping the
+    timezones with the same window.
+    """
+    tzstrs, offset_table = all_zones_offset_table(tz_backend)
+    start = (date - datetime.date(1970, 1, 1)).days * 86400
+    windows = {}
+    for index, tzstr in enumerate(tzstrs):
+        window = tuple(local_to_utc(offset_table, index, local) for local in (start, start + 86400))
+        windows.setdefault(window, []).append(tzstr)
+    return tuple((window, tuple(tzstrs)) for window, tzstrs in windows.items())
+
+
+def local_to_utc(offset_table, index, local):
+    "POSIX timestamp of local time `local` (seconds since 1970-01-01 00:00 local) in timezone `index`"
+    utc = local - offset_table.offset_at(index, local)
+    # the offset at the guess differs across a transition
+    utc = local - offset_table.offset_at(index, utc)
+    if utc + offset_table.offset_at(index, utc) < local:
+        # a local time in a gap maps to the instant of the transition's end
+        utc = offset_table.next_transition(index, utc)
+    return utc
+
+
+def local_date_filter(model, datetime_field, tz_field, date):
+    """
+    Q object matching the rows of `model` whose `datetime_field`, in the
+    timezone in its TimeZoneField `tz_field`, falls on `date`:
+
+        Event.objects.filter(local_date_filter(Event, "created_at", "tz", date(2026, 10, 17)))
+
+    It's an OR of (tz IN (...) AND created_at >= ... AND created_at < ...), one
+    per group of timezones sharing the same UTC window for the date, so an
+    index on the datetime column can be used.
+    """
+    field = model._meta.get_field(tz_field)  # pylint: disable=protected-access
+    filters = []
+    for (start, end), tzstrs in local_date_windows(field.tz_backend, date):
+        if field.integer_storage:
+            tzstrs = [tzstr for tzstr in tzstrs if tzstr in ZONE_IDS]
+        filters.append(
+            Q(
+                (f"{tz_field}__in", tzstrs),
+                (f"{datetime_field}__gte", datetime.datetime.fromtimestamp(start, datetime.timezone.utc)),
+                (f"{datetime_field}__lt", datetime.datetime.fromtimestamp(end, datetime.timezone.utc)),
+            )
+        )
+    return reduce(or_, filters)
@@ -0,0 +1,33 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from timezone_field.backends.bundle import build_bundle
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the timezone bundle file read by the bundle backend from the timezone DB installed for zoneinfo "
+        "(the system's or the tzdata package's). Processes using the current bundle keep using it until restarted."
+    )
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            nargs="?",
+            default=getattr(settings, "TIMEZONE_FIELD_BUNDLE", None),
+            help="Path of the bundle to write, defaults to the TIMEZONE_FIELD_BUNDLE setting",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not path:
+            raise CommandError("No path given and the TIMEZONE_FIELD_BUNDLE setting isn't set.")
+        try:
+            count = build_bundle(path)
+        except OSError as err:
+            raise CommandError(f"Could not write {path}: {err}") from err
+        self.stdout.write(f"Wrote {count} timezones to {path} ({os.path.getsize(path) / 1024:.1f} KiB)")
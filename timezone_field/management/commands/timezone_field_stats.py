@@ -0,0 +1,200 @@
+import gc
+import sys
+import tracemalloc
+from collections import namedtuple
+
+from django import forms
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from timezone_field.backends.offsets import OffsetTable
+from timezone_field.choices import FrozenChoices, GMTOffsetChoices, LazyChoices, choices_cache
+from timezone_field.fields import TimeZoneField
+from timezone_field.forms import TimeZoneFormField
+
+# name, number of items (timezones, choices), retained size in bytes
+Structure = namedtuple("Structure", ["name", "count", "size"])
+
+# label, name of its choices' Structure, name of its default_tzs' Structure (None for form fields)
+FieldUsage = namedtuple("FieldUsage", ["label", "choices", "default_tzs"])
+
+# attributes of the objects walked by deep_size that aren't part of them
+SHARED_ATTRS = {"tz_backend", "lock", "numpy"}
+
+
+def format_bytes(size):
+    return f"{size / 1024:.1f} KiB"
+
+
+def all_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from all_subclasses(subclass)
+
+
+def iter_fields():
+    "(label, field) for every TimeZoneField of installed models, and TimeZoneFormField of loaded forms"
+    for model in apps.get_models():
+        for field in model._meta.get_fields():  # pylint: disable=protected-access
+            if isinstance(field, TimeZoneField):
+                yield f"{model._meta.label}.{field.name}", field  # pylint: disable=protected-access
+    seen = set()
+    for form in all_subclasses(forms.BaseForm):
+        for name, field in getattr(form, "base_fields", {}).items():
+            if isinstance(field, TimeZoneFormField) and id(field) not in seen:
+                seen.add(id(field))
+                yield f"{form.__module__}.{form.__qualname__}.{name}", field
+
+
+class SizeCounter:
+    """
+    Sums the sizes of the containers, strings and arrays making up shared
+    structures, counting every object once across all of them.
+
+    Timezone objects are implemented in C and don't expose what they hold:
+    they're collected in `tzobjs`, to be measured with tracemalloc.
+    """
+
+    def __init__(self, tz_backends):
+        self.tz_backends = tz_backends
+        # id -> object, keeping them alive so ids aren't reused
+        self.seen = {}
+        self.tzobjs = {}
+
+    def is_tzobj(self, obj):
+        return any(tz_backend.is_tzobj(obj) for tz_backend in self.tz_backends)
+
+    def deep_size(self, obj):
+        "Bytes held by obj and the objects it references that weren't counted yet"
+        size = 0
+        stack = [obj]
+        while stack:
+            obj = stack.pop()
+            if id(obj) in self.seen or id(obj) in self.tzobjs:
+                continue
+            if self.is_tzobj(obj):
+                self.tzobjs[id(obj)] = obj
+                continue
+            self.seen[id(obj)] = obj
+            size += sys.getsizeof(obj)
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend(obj)
+            elif isinstance(obj, (FrozenChoices, GMTOffsetChoices, OffsetTable)):
+                attrs = vars(obj)
+                size += sys.getsizeof(attrs)
+                stack.extend(value for name, value in attrs.items() if name not in SHARED_ATTRS)
+        return size
+
+
+def tzobjs_size(tz_backend, tzstrs):
+    "Bytes retained by new timezone objects for tzstrs, built with tracemalloc tracing"
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        tzobjs = [tz_backend.build_tzobj(tzstr) for tzstr in tzstrs]
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(tzobjs)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def get_frozen_choices(field):
+    choices = field.choices
+    return choices.frozen if isinstance(choices, LazyChoices) else choices
+
+
+def collect():
+    """
+    Measure the shared structures behind every timezone field: the timezone
+    objects, the backends' caches and default timezones, and each distinct
+    list of choices. Returns ([Structure], [FieldUsage]).
+
+    Sizes are of what the structures hold now, so they don't depend on which
+    field built them first, and each object is counted once.
+    """
+    fields = list(iter_fields())
+    tz_backends = list({id(field.tz_backend): field.tz_backend for _, field in fields}.values())
+    # build every field's choices and default timezones
+    for _, field in fields:
+        get_frozen_choices(field)
+        if isinstance(field, TimeZoneField):
+            field.default_tzs  # pylint: disable=pointless-statement
+
+    counter = SizeCounter(tz_backends)
+    structures = []
+    names = {}
+
+    def add(name, obj, count=None):
+        names[id(obj)] = name
+        structures.append(Structure(name, len(obj) if count is None else count, counter.deep_size(obj)))
+
+    for tz_backend in tz_backends:
+        backend_name = tz_backend.__class__.__name__
+        add(f"{backend_name}.tzobj_cache", tz_backend.tzobj_cache.data)
+        add(f"{backend_name}.transitions_cache", tz_backend.transitions_cache)
+        for attr in ["base_tzobjs", "canonical_tzobjs"]:
+            if attr in vars(tz_backend):
+                add(f"{backend_name}.{attr}", vars(tz_backend)[attr])
+
+    gmt_offset_choices = {
+        id(choices.choices): choices for choices in choices_cache.values() if isinstance(choices, GMTOffsetChoices)
+    }
+    usages = []
+    for label, field in fields:
+        frozen = get_frozen_choices(field)
+        if id(frozen) not in names:
+            owner = gmt_offset_choices.get(id(frozen))
+            add(f"choices #{sum(name.startswith('choices') for name in names.values()) + 1}", frozen)
+            if owner is not None:
+                # the state kept to refresh the choices
+                structures[-1] = structures[-1]._replace(size=structures[-1].size + counter.deep_size(owner))
+        default_tzs = None
+        if isinstance(field, TimeZoneField):
+            if id(field.default_tzs) not in names:
+                add(f"{label}.default_tzs", field.default_tzs)
+            default_tzs = names[id(field.default_tzs)]
+        usages.append(FieldUsage(label, names[id(frozen)], default_tzs))
+
+    for tz_backend in tz_backends:
+        tzobjs = [tzobj for tzobj in counter.tzobjs.values() if tz_backend.is_tzobj(tzobj)]
+        for tzobj in tzobjs:
+            del counter.tzobjs[id(tzobj)]
+        size = tzobjs_size(tz_backend, sorted(str(tzobj) for tzobj in tzobjs))
+        structures.append(Structure(f"{tz_backend.__class__.__name__} timezone objects", len(tzobjs), size))
+
+    return structures, usages
+
+
+class Command(BaseCommand):
+    help = (
+        "Report the memory held by the structures shared by every TimeZoneField and TimeZoneFormField: their "
+        "choices, default timezones, timezone objects and the backends' caches, and which fields use them."
+    )
+
+    # checks build the choices, which are built when measured anyway
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        structures, usages = collect()
+        self.stdout.write(f"{'structure':60} {'items':>8} {'size':>13}")
+        for structure in structures:
+            self.stdout.write(f"{structure.name:60} {structure.count:8} {format_bytes(structure.size):>13}")
+
+        self.stdout.write("")
+        self.stdout.write(f"{'field':60} {'choices':>12}  default_tzs")
+        for usage in usages:
+            self.stdout.write(f"{usage.label:60} {usage.choices:>12}  {usage.default_tzs or '-'}")
+
+        total = sum(structure.size for structure in structures)
+        choices_count = sum(structure.name.startswith("choices") for structure in structures)
+        self.stdout.write("")
+        self.stdout.write(
+            f"{len(usages)} fields, {choices_count} distinct choice lists, {format_bytes(total)} in total"
+        )
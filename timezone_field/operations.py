@@ -0,0 +1,81 @@
+from collections import defaultdict
+
+from django.db.migrations.operations.base import Operation
+
+
+class CopyTimeZones(Operation):
+    """
+    Migration operation copying the values of the TimeZoneField `from_field`
+    of a model to its TimeZoneField `to_field`, `batch_size` rows at a time.
+    Reversing it copies them back.
+
+    Used to move a field between storage modes, eg: to integer storage:
+
+        operations = [
+            migrations.AddField("mymodel", "tz_id", TimeZoneField(integer_storage=True, null=True)),
+            CopyTimeZones("mymodel", "tz", "tz_id"),
+            migrations.RemoveField("mymodel", "tz"),
+            migrations.RenameField("mymodel", "tz_id", "tz"),
+            migrations.AlterField("mymodel", "tz", TimeZoneField(integer_storage=True)),
+        ]
+
+    With `atomic = False` on the migration, each batch is committed separately.
+    """
+
+    reversible = True
+
+    def __init__(self, model_name, from_field, to_field, batch_size=1000):
+        self.model_name = model_name
+        self.from_field = from_field
+        self.to_field = to_field
+        self.batch_size = batch_size
+
+    def deconstruct(self):
+        kwargs = {"model_name": self.model_name, "from_field": self.from_field, "to_field": self.to_field}
+        if self.batch_size != 1000:
+            kwargs["batch_size"] = self.batch_size
+        return (self.__class__.__name__, [], kwargs)
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            copy_timezones(model, self.from_field, self.to_field, self.batch_size, schema_editor.connection.alias)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            copy_timezones(model, self.to_field, self.from_field, self.batch_size, schema_editor.connection.alias)
+
+    def describe(self):
+        return f"Copy timezones from {self.model_name}.{self.from_field} to {self.model_name}.{self.to_field}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"copy_{self.model_name.lower()}_{self.from_field}_to_{self.to_field}"
+
+
+def copy_timezones(model, from_field, to_field, batch_size=1000, using=None):
+    """
+    Copy the timezones in `from_field` to `to_field` for every row of `model`,
+    walking the table in primary key order, with one UPDATE per distinct
+    timezone in each batch.
+    """
+    # pylint: disable=protected-access
+    manager = model._base_manager.db_manager(using)
+    last_pk = None
+    while True:
+        rows = manager.order_by("pk")
+        if last_pk is not None:
+            rows = rows.filter(pk__gt=last_pk)
+        rows = list(rows.values_list("pk", from_field)[:batch_size])
+        if not rows:
+            break
+        pks_by_value = defaultdict(list)
+        for pk, value in rows:
+            pks_by_value[value].append(pk)
+        for value, pks in pks_by_value.items():
+            manager.filter(pk__in=pks).update(**{to_field: value})
+        last_pk = rows[-1][0]
@@ -1,26 +1,109 @@
 from django.utils.encoding import force_str
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from rest_framework.fields import CharField
+from rest_framework.serializers import ListSerializer
 
+from timezone_field import instrumentation
 from timezone_field.backends import TimeZoneNotFoundError, get_tz_backend
 
+try:
+    from drf_spectacular.extensions import OpenApiSerializerFieldExtension
+except ImportError:
+    OpenApiSerializerFieldExtension = None
+
+# (timezone backend, allowed timezones, allow_blank) -> OpenAPI schema
+schema_cache = {}
+
 
 class TimeZoneSerializerField(CharField):
     default_error_messages = {
         "invalid": _("A valid timezone is required."),
+        "invalid_choice": _('"{input}" is not a valid choice.'),
     }
 
     def __init__(self, *args, **kwargs):
         self.use_pytz = kwargs.pop("use_pytz", None)
         self.tz_backend = get_tz_backend(use_pytz=self.use_pytz)
+        choices = kwargs.pop("choices", None)
+        # names of the timezones accepted, None for any
+        self.allowed_tzstrs = None if choices is None else frozenset(str(tz) for tz in choices)
         super().__init__(*args, **kwargs)
 
+    @cached_property
+    def conversions(self):
+        """
+        Dict of input string -> timezone object when validating a list of items
+        (many=True), else None.
+
+        A ListSerializer validates every item with the same child serializer,
+        and so the same field instance, created for each request. Bulk input
+        tends to repeat a few timezones, each then converted once.
+        """
+        return {} if isinstance(self.root, ListSerializer) else None
+
     def to_internal_value(self, data):
         data_str = force_str(data)
+        conversions = self.conversions
+        if conversions is not None:
+            try:
+                return conversions[data_str]
+            except KeyError:
+                pass
         try:
-            return self.tz_backend.to_tzobj(data_str)
+            tzobj = self.tz_backend.get_tzobj(data_str)
         except TimeZoneNotFoundError:
+            instrumentation.record("serializer_field.invalid", value=data_str)
             self.fail("invalid")
+        if self.allowed_tzstrs is not None and str(tzobj) not in self.allowed_tzstrs:
+            instrumentation.record("serializer_field.invalid", value=data_str)
+            self.fail("invalid_choice", input=data_str)
+        if conversions is not None:
+            conversions[data_str] = tzobj
+        return tzobj
 
     def to_representation(self, value):
         return str(value)
+
+    def get_schema(self):
+        """
+        OpenAPI schema of the field: a string enum of the timezone names it
+        accepts, and an example. Built once per timezone backend and set of
+        allowed timezones, returned as a new dict and list: callers may edit them.
+        """
+        key = (self.tz_backend, self.allowed_tzstrs, self.allow_blank)
+        schema = schema_cache.get(key)
+        if schema is None:
+            tzstrs = self.tz_backend.all_tzstrs if self.allowed_tzstrs is None else self.allowed_tzstrs
+            enum = sorted(tzstrs)
+            example = "UTC" if "UTC" in tzstrs else enum[0] if enum else ""
+            if self.allow_blank:
+                enum.insert(0, "")
+            schema = schema_cache.setdefault(key, {"type": "string", "enum": tuple(enum), "example": example})
+        return {**schema, "enum": list(schema["enum"])}
+
+
+class TimeZoneSchemaMixin:
+    """
+    Mixin for rest_framework.schemas.openapi.AutoSchema describing
+    TimeZoneSerializerFields with their get_schema():
+
+        class AutoSchema(TimeZoneSchemaMixin, openapi.AutoSchema):
+            pass
+    """
+
+    def map_field(self, field):
+        if isinstance(field, TimeZoneSerializerField):
+            return field.get_schema()
+        return super().map_field(field)
+
+
+if OpenApiSerializerFieldExtension is not None:
+
+    class TimeZoneSerializerFieldExtension(OpenApiSerializerFieldExtension):
+        "Describes TimeZoneSerializerFields in drf-spectacular schemas, registered when defined"
+
+        target_class = TimeZoneSerializerField
+
+        def map_serializer_field(self, auto_schema, direction):  # pylint: disable=unused-argument
+            return self.target.get_schema()
@@ -1,6 +1,15 @@
 from django.db.models.query_utils import DeferredAttribute
 
 
+class RawDBValue(str):
+    """
+    A value loaded from the DB, left for AutoDeserializedAttribute to pass
+    through the field's `to_python` the first time it's read.
+    """
+
+    __slots__ = ()
+
+
 class AutoDeserializedAttribute(DeferredAttribute):
     """
     Use as the descriptor_class for a Django custom field.
@@ -14,6 +23,17 @@ class AutoDeserializedAttribute(DeferredAttribute):
     # (Adapted from django.db.models.fields.subclassing.Creator,
     # which was included in Django 1.8 and earlier.)
 
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if type(value) is RawDBValue:  # pylint: disable=unidiomatic-typecheck
+            value = instance.__dict__[self.field.attname] = self.field.to_python(str(value))
+        return value
+
     def __set__(self, instance, value):
-        value = self.field.to_python(value)
+        # Model.from_db() sets the values already converted by from_db_value(),
+        # or, for fields deserializing lazily, the raw values
+        if value is not None and not self.field.is_python_value(value) and type(value) is not RawDBValue:
+            value = self.field.to_python(value)
         instance.__dict__[self.field.attname] = value